@@ -5,33 +5,64 @@
 # query components and assembling them into complete queries.
 
 
-from typing import Any, Dict, List, Optional, Union, Tuple
-from dataclasses import dataclass, field
+from dataclasses import field
+from typing import Any, List, Optional, Union, Tuple
+from itertools import chain
 
 # Import expression and pattern classes
 from .ast import Expression, OrderByExpression, Property, Variable, Parameter, Literal, FunctionExpression
 from .ast import NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern, BaseLabelExpr, L, LabelAtom
-from .clauses.clause import Clause
-from .clauses.use import UseClause
-from .clauses.call_procedure import CallProcedureClause
-from .clauses.yield_ import YieldClause
-from .compound_query import CompoundQuery
-from .clauses.match import MatchClause
-from .clauses.unwind import UnwindClause
-from .clauses.call_subquery import CallSubqueryClause
-from .clauses.return_ import ReturnClause
-
-
-@dataclass(frozen=True)
+from .ast.patterns.relationship_pattern import _DIRECTION_ALIASES
+from .ast.formatting_utils import cached_cypher
+from .clauses import (
+    Clause, MatchClause, OptionalMatchClause, WhereClause, WithClause, ReturnClause,
+    GroupByClause, OrderByClause, SkipClause, LimitClause, UnwindClause, UseClause,
+    CallSubqueryClause, CallProcedureClause, YieldClause,
+)
+from .clauses.clause import KIND_OTHER, KIND_PROJECTION
+from .clauses.next_ import NEXT
+from .clauses.limit import _shared_limit_clause
+from .clauses.return_ import RETURN_ALL, RETURN_DISTINCT_ALL
+from .clauses.skip import _shared_skip_clause
+from .compound_query import UNION, UNION_ALL, CompoundQuery
+from .utils.dataclass import fast_frozen_dataclass
+
+
+@fast_frozen_dataclass(slots=True)
 class QueryBuilder:
     """
     A builder for constructing Cypher queries in a fluent, chainable manner.
+    
+    The query is a flat, ordered tuple of clauses; each chained call returns a
+    new builder whose tuple extends the previous one.
     """
-    clauses: List[Clause] = field(default_factory=list)
+    clauses: Union[Tuple[Clause, ...], List[Clause]] = ()
+    # Builders are immutable, so the rendered query is cached like a clause's
+    _cypher_cache: Optional[Tuple[str, str]] = field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    def __post_init__(self):
+        # Store clauses as an immutable tuple; lists are accepted for convenience
+        if type(self.clauses) is not tuple:
+            object.__setattr__(self, "clauses", tuple(self.clauses))
+
+    def _append(self, clause: Clause) -> 'QueryBuilder':
+        """
+        Return a new builder with the clause added at the end.
+        
+        Bypasses the generated ``__init__``: the clauses are already a tuple, so
+        only the fields have to be set. Every slot is assigned, including the
+        hash and render caches, so copying and pickling see a complete object.
+        """
+        builder = QueryBuilder.__new__(QueryBuilder)
+        object.__setattr__(builder, "clauses", self.clauses + (clause,))
+        object.__setattr__(builder, "_hash_cache", None)
+        object.__setattr__(builder, "_cypher_cache", None)
+        return builder
 
     def match(self, *patterns: Union[NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern]) -> 'QueryBuilder':
-        from .clauses.match import MatchClause
-        return QueryBuilder(self.clauses + [MatchClause(list(patterns))])
+        return self._append(MatchClause(patterns))
 
     def optional_match(self, *patterns: Union[NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern]) -> 'QueryBuilder':
         """
@@ -46,23 +77,15 @@ class QueryBuilder:
         Example:
             >>> query = QueryBuilder().optional_match(node("p", "Person"))
         """
-        from .clauses.optional_match import OptionalMatchClause
-        return QueryBuilder(self.clauses + [OptionalMatchClause(list(patterns))])
+        return self._append(OptionalMatchClause(patterns))
 
     def where(self, condition: Expression) -> 'QueryBuilder':
-        from .clauses.where import WhereClause
-        return QueryBuilder(self.clauses + [WhereClause(condition)])
+        return self._append(WhereClause(condition))
 
     def with_(self, *projections: Union[str, Tuple[str, str]], distinct: bool = False) -> 'QueryBuilder':
-        from .clauses.with_ import WithClause
-        # Convert to list of projections (string or tuple)
-        proj_list = []
-        for p in projections:
-            if isinstance(p, tuple):
-                proj_list.append(p)
-            else:
-                proj_list.append(p)
-        return QueryBuilder(self.clauses + [WithClause(proj_list, distinct)])
+        # Projections (strings or (expression, alias) tuples) are stored as
+        # given, so the *projections tuple is passed through without a copy
+        return self._append(WithClause(projections, distinct))
 
     def return_(self, *projections: Union[str, Tuple[str, str]], distinct: bool = False) -> 'QueryBuilder':
         """
@@ -76,7 +99,6 @@ class QueryBuilder:
             >>> query.return_("p.name", ("p.age", "age"))
             >>> query.return_(node_pattern)  # Uses node_pattern.variable
         """
-        from .clauses.return_ import ReturnClause
         processed_projections = []
         
         for proj in projections:
@@ -96,10 +118,9 @@ class QueryBuilder:
         typed_projections: List[Tuple[str, Optional[str]]] = processed_projections
                 
         if not processed_projections:
-            processed_projections = [('*', None)]
-            typed_projections = [('*', None)]
+            return self._append(RETURN_DISTINCT_ALL if distinct else RETURN_ALL)
             
-        return QueryBuilder(self.clauses + [ReturnClause(typed_projections, distinct)])
+        return self._append(ReturnClause(typed_projections, distinct))
         
     def group_by(self, *expressions: str) -> 'QueryBuilder':
         """
@@ -114,53 +135,47 @@ class QueryBuilder:
         Example:
             >>> query = match(node("p", "Person")).return_("p.department", count().as_("employees")).group_by("p.department")
         """
-        from .clauses.group_by import GroupByClause
-        return QueryBuilder(self.clauses + [GroupByClause(list(expressions))])
+        return self._append(GroupByClause(expressions))
 
     def order_by(self, *fields: Union[str, OrderByExpression]) -> 'QueryBuilder':
-        from .clauses.order_by import OrderByClause
-        from .ast.expressions import OrderByExpression as OrderByExpr
-        expressions = []
-        for field in fields:
-            if isinstance(field, str):
-                expressions.append(OrderByExpr(field, False))  # ascending by default
-            else:
-                expressions.append(field)
-        return QueryBuilder(self.clauses + [OrderByClause(expressions)])
+        # Plain strings sort ascending by default
+        expressions = tuple(
+            OrderByExpression(field, False) if isinstance(field, str) else field
+            for field in fields
+        )
+        return self._append(OrderByClause(expressions))
 
     def skip(self, count: Union[int, Expression]) -> 'QueryBuilder':
-        from .clauses.skip import SkipClause
         # Remove existing skip clauses to ensure the last one takes precedence
-        new_clauses = [c for c in self.clauses if not isinstance(c, SkipClause)]
-        return QueryBuilder(new_clauses + [SkipClause(count)])
+        new_clauses = tuple(c for c in self.clauses if not isinstance(c, SkipClause))
+        clause = _shared_skip_clause(count) if type(count) is int else SkipClause(count)
+        return QueryBuilder(new_clauses + (clause,))
 
     def limit(self, count: Union[int, Expression]) -> 'QueryBuilder':
-        from .clauses.limit import LimitClause
         # Remove existing limit clauses to ensure the last one takes precedence
-        new_clauses = [c for c in self.clauses if not isinstance(c, LimitClause)]
-        return QueryBuilder(new_clauses + [LimitClause(count)])
+        new_clauses = tuple(c for c in self.clauses if not isinstance(c, LimitClause))
+        clause = _shared_limit_clause(count) if type(count) is int else LimitClause(count)
+        return QueryBuilder(new_clauses + (clause,))
 
     def union(self, other: "QueryBuilder") -> "CompoundQuery":
         """
         Combines this query with another using UNION.
         """
-        return CompoundQuery(queries=[self, other], union_operators=["UNION"])
+        return CompoundQuery((self, other), (UNION,))
 
     def union_all(self, other: "QueryBuilder") -> "CompoundQuery":
         """
         Combines this query with another using UNION ALL.
         """
-        return CompoundQuery(queries=[self, other], union_operators=["UNION ALL"])
+        return CompoundQuery((self, other), (UNION_ALL,))
     
     def call_subquery(self, subquery: 'QueryBuilder', variables: Optional[Union[str, List[str]]] = None) -> 'QueryBuilder':
         """Add a CALL subquery clause to the query."""
-        from .clauses.call_subquery import CallSubqueryClause
-        return QueryBuilder(self.clauses + [CallSubqueryClause(subquery, variables)])
+        return self._append(CallSubqueryClause(subquery, variables))
         
     def optional_call_subquery(self, subquery: 'QueryBuilder', variables: Optional[Union[str, List[str]]] = None) -> 'QueryBuilder':
         """Add an OPTIONAL CALL subquery clause to the query."""
-        from .clauses.call_subquery import CallSubqueryClause
-        return QueryBuilder(self.clauses + [CallSubqueryClause(subquery, variables, optional=True)])
+        return self._append(CallSubqueryClause(subquery, variables, optional=True))
         
     def call_procedure(self, procedure_name: str, *arguments: Union[str, Expression], optional: bool = False) -> 'QueryBuilder':
         """
@@ -179,7 +194,7 @@ class QueryBuilder:
             >>> query = QueryBuilder().call_procedure("dbms.checkConfigValue", "server.bolt.enabled", "true")
             >>> query = QueryBuilder().optional_call_procedure("apoc.neighbors.tohop", var("n"), "KNOWS>", 1)
         """
-        return QueryBuilder(self.clauses + [CallProcedureClause(procedure_name, list(arguments), optional)])
+        return self._append(CallProcedureClause(procedure_name, arguments, optional))
         
     def optional_call_procedure(self, procedure_name: str, *arguments: Union[str, Expression]) -> 'QueryBuilder':
         """
@@ -213,15 +228,12 @@ class QueryBuilder:
             >>> query = QueryBuilder().call_procedure("db.propertyKeys").yield_(("propertyKey", "prop"))
             >>> query = QueryBuilder().call_procedure("db.labels").yield_(wildcard=True)
         """
-        # Process column specifications
-        processed_columns = []
-        for col in columns:
-            if isinstance(col, tuple):
-                processed_columns.append(col)
-            else:
-                processed_columns.append((col, None))
-                
-        return QueryBuilder(self.clauses + [YieldClause(processed_columns, wildcard)])
+        # Process column specifications into the (column, alias) tuple the
+        # clause stores
+        processed_columns = tuple([
+            col if isinstance(col, tuple) else (col, None) for col in columns
+        ])
+        return self._append(YieldClause(processed_columns, wildcard))
 
     def use(self, database: Union[str, Expression]) -> 'QueryBuilder':
         """
@@ -241,11 +253,10 @@ class QueryBuilder:
             >>> query = QueryBuilder().use("movies").match(node("m:Movie"))
             >>> query = QueryBuilder().use(function("graph.byName", var("graphName")))
         """
-        from .clauses.use import UseClause
         # Remove any existing USE clauses
-        new_clauses = [c for c in self.clauses if not isinstance(c, UseClause)]
+        new_clauses = tuple(c for c in self.clauses if not isinstance(c, UseClause))
         # Add new USE clause at beginning
-        return QueryBuilder([UseClause(database)] + new_clauses)
+        return QueryBuilder((UseClause(database),) + new_clauses)
 
     def unwind(self, expression: Expression, variable: str) -> 'QueryBuilder':
         """
@@ -261,7 +272,7 @@ class QueryBuilder:
         Example:
             >>> query = QueryBuilder().unwind(literal([1,2,3]), "num")
         """
-        return QueryBuilder(self.clauses + [UnwindClause(expression, variable)])
+        return self._append(UnwindClause(expression, variable))
 
     def next(self) -> 'QueryBuilder':
         """
@@ -277,9 +288,9 @@ class QueryBuilder:
             ...          .match(var("customer").relationship("BUYS").node("Product", {"name": "Chocolate"}))
             ...          .return_(var("customer").prop("firstName").as_("chocolateCustomer")))
         """
-        from .clauses.next_ import NextClause
-        return QueryBuilder(self.clauses + [NextClause()])
+        return self._append(NEXT)
 
+    @cached_cypher
     def to_cypher(self, indent: str = "") -> str:
         """
         Converts the constructed query to a Cypher string.
@@ -290,50 +301,31 @@ class QueryBuilder:
         Returns:
             Cypher string representation of the query
         """
-        from .clauses.return_ import ReturnClause
-        from .clauses.with_ import WithClause
-        from .clauses.limit import LimitClause
-        from .clauses.skip import SkipClause
-        from .clauses.order_by import OrderByClause
-        from .clauses.call_subquery import CallSubqueryClause
-
-        # Separate pagination clauses from the rest
-        pagination_clauses = []
+        # Separate pagination clauses from the rest in one pass, bucketed by
+        # clause kind in the order they must be rendered: ORDER BY, SKIP, LIMIT
         all_clauses = []
+        buckets = (all_clauses, [], [], [])
+        needs_return = True
         for c in self.clauses:
-            if isinstance(c, (OrderByClause, SkipClause, LimitClause)):
-                pagination_clauses.append(c)
-            else:
+            # Objects that are not Clause subclasses render in place
+            kind = getattr(c, "_KIND", KIND_OTHER)
+            if kind == KIND_PROJECTION:
+                needs_return = False
                 all_clauses.append(c)
-
-        # Define the correct order for pagination clauses
-        pagination_order = {
-            "OrderByClause": 0,
-            "SkipClause": 1,
-            "LimitClause": 2,
-        }
-
-        # Sort the pagination clauses
-        sorted_pagination_clauses = sorted(
-            pagination_clauses,
-            key=lambda c: pagination_order.get(c.__class__.__name__, 99)
-        )
+            else:
+                buckets[kind].append(c)
+        _, order_by_clauses, skip_clauses, limit_clauses = buckets
 
         # A special case for queries that end with LIMIT/SKIP without a RETURN or WITH.
         # A RETURN * should be implicitly added, but not for CALL subquery clauses
-        if sorted_pagination_clauses and not any(isinstance(c, (ReturnClause, WithClause, CallSubqueryClause)) for c in all_clauses):
-            all_clauses.append(ReturnClause([('*', None)]))
+        if needs_return and (order_by_clauses or skip_clauses or limit_clauses):
+            all_clauses.append(RETURN_ALL)
 
-        # Add sorted pagination clauses at the end
-        all_clauses.extend(sorted_pagination_clauses)
-        
-        # Generate Cypher for each clause with optional indentation
-        cypher_lines = []
-        for clause in all_clauses:
-            clause_cypher = clause.to_cypher(indent=indent)
-            cypher_lines.append(clause_cypher)
-        
-        return "\n".join(cypher_lines)
+        # Add pagination clauses at the end and render every clause once
+        all_clauses += order_by_clauses
+        all_clauses += skip_clauses
+        all_clauses += limit_clauses
+        return "\n".join([clause.to_cypher(indent=indent) for clause in all_clauses])
 
 
 def match(*patterns: Union[NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern]) -> QueryBuilder:
@@ -349,7 +341,7 @@ def match(*patterns: Union[NodePattern, RelationshipPattern, PathPattern, Quanti
     Example:
         >>> query = match(node("p", "Person")).where(prop("p", "age") > 30)
     """
-    return QueryBuilder([MatchClause(list(patterns))])
+    return QueryBuilder((MatchClause(patterns),))
 
 
 def use(database: Union[str, Expression]) -> QueryBuilder:
@@ -367,7 +359,7 @@ def use(database: Union[str, Expression]) -> QueryBuilder:
         >>> query = use("movies").match(node("m:Movie"))
         >>> query = use(function("graph.byName", var("graphName")))
     """
-    return QueryBuilder([UseClause(database)])
+    return QueryBuilder((UseClause(database),))
 
 def unwind(expression: Expression, variable: str) -> QueryBuilder:
     """
@@ -383,7 +375,7 @@ def unwind(expression: Expression, variable: str) -> QueryBuilder:
     Example:
         >>> query = unwind(literal([1,2,3]), "num").return_("num")
     """
-    return QueryBuilder([UnwindClause(expression, variable)])
+    return QueryBuilder((UnwindClause(expression, variable),))
     
 def call_procedure(procedure_name: str, *arguments: Union[str, Expression], optional: bool = False) -> QueryBuilder:
     """
@@ -401,7 +393,7 @@ def call_procedure(procedure_name: str, *arguments: Union[str, Expression], opti
         >>> query = call_procedure("db.labels")
         >>> query = call_procedure("dbms.checkConfigValue", "server.bolt.enabled", "true")
     """
-    return QueryBuilder([CallProcedureClause(procedure_name, list(arguments), optional)])
+    return QueryBuilder((CallProcedureClause(procedure_name, arguments, optional),))
 
 def optional_call_procedure(procedure_name: str, *arguments: Union[str, Expression]) -> QueryBuilder:
     """
@@ -484,7 +476,7 @@ def node(
     return NodePattern(
         variable=variable, 
         labels=tuple(processed_labels), 
-        properties=properties,
+        properties=properties or (),
         max_degree=max_degree,
         degree_direction=degree_direction,
         degree_rel_type=degree_rel_type
@@ -515,15 +507,7 @@ def relationship(
         >>> knows_or_likes = relationship("KNOWS", "LIKES", direction=">", variable="r")
     """
     # Map direction to RelationshipPattern's internal representation
-    if direction in ("->", ">"):
-        direction = ">"
-    elif direction in ("<-", "<"):
-        direction = "<"
-    elif direction not in ("-", "--"):
-        direction = "-"
-    else:
-        # Already in correct format
-        pass
+    direction = _DIRECTION_ALIASES.get(direction, "-")
 
     # Join the types with | for Cypher OR syntax
     type_str = "|".join(types) if types else ""
@@ -532,7 +516,7 @@ def relationship(
         direction=direction,
         variable=variable,
         type=type_str,
-        properties=properties,
+        properties=properties or (),
     )
 
 
@@ -552,13 +536,10 @@ def path(*elements: Union[NodePattern, RelationshipPattern, PathPattern]) -> Pat
         >>> extended_path = path(base_path, node("c"))
         >>> # Results in: (a)-[r]->(b)--(c)
     """
-    flattened = []
-    for elem in elements:
-        if isinstance(elem, PathPattern):
-            flattened.extend(elem.elements)
-        else:
-            flattened.append(elem)
-    return PathPattern(flattened)
+    return PathPattern(tuple(chain.from_iterable(
+        elem.elements if isinstance(elem, PathPattern) else (elem,)
+        for elem in elements
+    )))
 
 
 def prop(variable: str, property_name: str) -> Property:
@@ -776,17 +757,14 @@ def sequence(*queries: QueryBuilder) -> QueryBuilder:
     if not queries:
         return QueryBuilder()
     
-    # Start with the first query
-    current = queries[0]
-    
-    # Chain subsequent queries with next()
+    # Collect every clause once, with a NEXT clause between consecutive
+    # queries, instead of copying the growing tuple for each query
+    clauses = list(queries[0].clauses)
     for next_query in queries[1:]:
-        # First add a NEXT clause
-        current = current.next()
-        # Then add all clauses from the next query
-        current = QueryBuilder(current.clauses + next_query.clauses)
+        clauses.append(NEXT)
+        clauses.extend(next_query.clauses)
     
-    return current
+    return QueryBuilder(tuple(clauses))
 
 
 def call_subquery(subquery: QueryBuilder, variables: Optional[Union[str, List[str]]] = None) -> QueryBuilder:
@@ -827,8 +805,7 @@ def call_subquery(subquery: QueryBuilder, variables: Optional[Union[str, List[st
         >>> query = call_subquery(inner, "*")
         >>> # CALL(*) { MATCH (p:Person) RETURN p.name }
     """
-    from .clauses.call_subquery import CallSubqueryClause
-    return QueryBuilder([CallSubqueryClause(subquery, variables)])
+    return QueryBuilder((CallSubqueryClause(subquery, variables),))
 
 def optional_call_subquery(subquery: QueryBuilder, variables: Optional[Union[str, List[str]]] = None) -> QueryBuilder:
     """
@@ -865,5 +842,4 @@ def optional_call_subquery(subquery: QueryBuilder, variables: Optional[Union[str
         >>> query = optional_call_subquery(inner, ["p"])
         >>> # OPTIONAL CALL(p) { MATCH (p:Person) RETURN p.name }
     """
-    from .clauses.call_subquery import CallSubqueryClause
-    return QueryBuilder([CallSubqueryClause(subquery, variables, optional=True)])
+    return QueryBuilder((CallSubqueryClause(subquery, variables, optional=True),))
@@ -103,17 +103,23 @@ class ComparisonExpression(Expression):
             >>> ComparisonExpression(prop("p", "age"), ">", param("min_age"))
             >>> # Returns: "p.age > $min_age"
         """
-        left_cypher = (
-            self.left.to_cypher() 
-            if hasattr(self.left, 'to_cypher') 
-            else str(self.left)
-        )
-        right_cypher = (
-            self.right.to_cypher() 
-            if hasattr(self.right, 'to_cypher') 
-            else str(self.right)
-        )
-        return f"{left_cypher} {self.operator} {right_cypher}"
+        return f"{_operand_cypher(self.left)} {self.operator} {_operand_cypher(self.right)}"
+
+
+def _operand_cypher(value: Any) -> str:
+    """
+    Render one side of a comparison.
+    
+    Expressions, the usual operands, are dispatched with a plain isinstance
+    check; anything else is rendered through its own ``to_cypher`` if it has
+    one, or ``str`` otherwise.
+    """
+    if isinstance(value, Expression):
+        return value.to_cypher()
+    to_cypher = getattr(value, "to_cypher", None)
+    if to_cypher is not None:
+        return to_cypher()
+    return str(value)
 
 
 @dataclass(frozen=True)
@@ -9,7 +9,7 @@ class FunctionExpression(Expression):
     def to_cypher(self) -> str:
         if self.function_name.lower() == "count" and len(self.arguments) == 0:
             return "count(*)"
-        args_str = ", ".join(arg.to_cypher() for arg in self.arguments)
+        args_str = ", ".join([arg.to_cypher() for arg in self.arguments])
         distinct_str = "DISTINCT " if self.distinct else ""
         return f"{self.function_name}({distinct_str}{args_str})"
         
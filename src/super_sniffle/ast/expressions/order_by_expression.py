@@ -1,4 +1,3 @@
-from .expression import Expression
 
 class OrderByExpression:
     def __init__(self, field: str, descending: bool = False):
@@ -1,29 +1,70 @@
-from typing import Any
+import inspect
+import threading
+from functools import lru_cache, wraps
+from typing import Any, Callable, Optional
+
+# Scalar types whose formatted output depends only on the value itself.
+# Matched by exact type so that subclasses (and objects with overloaded
+# ``__eq__`` such as expressions) never share a cache entry. Floats are left
+# out: 0.0 and -0.0 compare equal but print differently, and NaN is unequal
+# to itself, so the cache would hand back the wrong text.
+_CACHEABLE_TYPES = frozenset({str, int, bool, type(None)})
+
 
 def format_value(value: Any) -> str:
     """
     Format a value for use in Cypher expressions and property constraints.
-    
+
+    Scalar values (strings, numbers, booleans and None) are memoized, since
+    the same literals tend to be formatted again on every render.
+
     Args:
         value: The value to format
-        
+
     Returns:
         String representation of the value in Cypher format
-        
+
     Example:
         >>> format_value(42) -> '42'
         >>> format_value("text") -> '"text"'
         >>> format_value(True) -> 'true'
         >>> format_value([1,2]) -> '[1,2]'
     """
+    if type(value) in _CACHEABLE_TYPES:
+        return _format_scalar(value)
+    return _format_value(value)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_scalar(value: Any) -> str:
+    """Cached formatting for hashable scalar values."""
+    return _format_value(value)
+
+
+_TRUE = "true"
+_FALSE = "false"
+_NULL = "null"
+
+
+def _format_value(value: Any) -> str:
+    """Uncached implementation of :func:`format_value`."""
+    # Exact-type checks first for the common literal types
+    value_type = type(value)
+    if value_type is str:
+        if '"' not in value:
+            return f'"{value}"'
+        return _format_string(value)
+    if value_type is bool:
+        return _TRUE if value else _FALSE
+    if value is None:
+        return _NULL
+    if value_type is int or value_type is float:
+        return str(value)
+    
     if isinstance(value, str):
-        # Escape double quotes in the string
-        escaped = value.replace('"', '\\"')
-        return f'"{escaped}"'
+        return _format_string(value)
     elif isinstance(value, bool):
-        return "true" if value else "false"
-    elif value is None:
-        return "null"
+        return _TRUE if value else _FALSE
     elif isinstance(value, (list, tuple)):
         # Format each element recursively
         formatted_elements = [format_value(item) for item in value]
@@ -34,3 +75,75 @@ def format_value(value: Any) -> str:
         return f'{{{", ".join(formatted_pairs)}}}'
     else:
         return str(value)
+
+
+def _format_string(value: str) -> str:
+    """Quote a string, escaping double quotes."""
+    escaped = value.replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+class _RenderState(threading.local):
+    """Per-thread count of renderings that included an unnamed node."""
+    unresolved = 0
+
+
+# A node without a variable may still be given one lazily, which changes how
+# it and everything containing it renders. Such nodes call
+# note_unresolved_render() while rendering, and cached_cypher only stores a
+# result if no call happened during that render. Only trees whose rendering
+# can still change are left uncached; naming one node never invalidates the
+# caches of unrelated queries. The count is per thread, so concurrent renders
+# do not see each other's calls.
+_render_state = _RenderState()
+
+
+def note_unresolved_render() -> None:
+    """Mark the rendering in progress as depending on a node that is not named yet."""
+    _render_state.unresolved += 1
+
+
+def cached_cypher(method: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoize ``to_cypher`` on a frozen pattern, clause or query builder.
+
+    The decorated class must define a ``_cypher_cache`` field (init=False,
+    compare=False) defaulting to None. It holds ``(indent, cypher)`` for the
+    most recent call, and is only filled when the rendering contained no node
+    still waiting for a lazily generated variable.
+
+    Methods that take an ``indent`` parameter are wrapped to accept None and
+    always receive a string ("" for None), so it can be used directly as the
+    line prefix. Methods without one are cached under "" and return a non-None
+    ``_anonymous_cypher`` field, where the class defines one, straight away.
+    """
+    if "indent" in inspect.signature(method).parameters:
+        @wraps(method)
+        def to_cypher(self: Any, indent: Optional[str] = None) -> str:
+            if indent is None:
+                indent = ""
+            # Subclasses declared without slots may not have set the cache yet
+            cache = getattr(self, "_cypher_cache", None)
+            if cache is not None and cache[0] == indent:
+                return cache[1]
+            unresolved = _render_state.unresolved
+            cypher = method(self, indent)
+            if _render_state.unresolved == unresolved:
+                object.__setattr__(self, "_cypher_cache", (indent, cypher))
+            return cypher
+        return to_cypher
+
+    @wraps(method)
+    def to_cypher_unindented(self: Any) -> str:
+        anonymous = getattr(self, "_anonymous_cypher", None)
+        if anonymous is not None:
+            return anonymous
+        cache = getattr(self, "_cypher_cache", None)
+        if cache is not None:
+            return cache[1]
+        unresolved = _render_state.unresolved
+        cypher = method(self)
+        if _render_state.unresolved == unresolved:
+            object.__setattr__(self, "_cypher_cache", ("", cypher))
+        return cypher
+    return to_cypher_unindented
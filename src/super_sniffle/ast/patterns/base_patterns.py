@@ -3,14 +3,10 @@ Base classes for pattern implementations to avoid circular imports.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Sequence, TYPE_CHECKING
+from typing import Optional, Sequence
 from ..expressions import Expression
 from .types import PatternElement
 
-if TYPE_CHECKING:
-    from .node_pattern import NodePattern
-    from .relationship_pattern import RelationshipPattern
-
 @dataclass(frozen=True)
 class BasePathPattern:
     """
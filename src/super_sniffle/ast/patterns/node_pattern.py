@@ -1,10 +1,11 @@
 from __future__ import annotations
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from typing import Optional, Tuple, Dict, Any, Union
 from .base_label_expr import BaseLabelExpr, L
-from ..expressions import Expression
-from super_sniffle.ast.formatting_utils import format_value
-from .relationship_pattern import RelationshipPattern  # Add import
+from ..expressions import Expression, Property
+from super_sniffle.ast.formatting_utils import format_value, cached_cypher, note_unresolved_render
+from .relationship_pattern import RelationshipPattern, _DIRECTION_ALIASES, _find_add_handler
+from .relationship_pattern import _init_add_dispatch as _init_relationship_add_dispatch
 from .path_pattern import PathPattern  # Add import
 
 # Lazy variable generation for anonymous nodes
@@ -48,6 +49,9 @@ _JAZZ_MUSICIANS = [
     "watson", "hughes", "sanders", "coleman", "murphy", "harrison", "garrett"
 ]
 
+# Operator characters that mark a label expression as needing backticks
+_LABEL_OPS = frozenset("&|!")
+
 def _get_next_variable_name() -> str:
     """Generate next automatic variable name using pre-1930s jazz musician surnames."""
     global _node_counter
@@ -75,7 +79,7 @@ class NodePattern:
     Attributes:
         variable: Optional variable name for the node (e.g., "p", "user")
         labels: Union[Tuple[Union[str, BaseLabelExpr], ...], BaseLabelExpr, str] = Labels or expressions
-        properties: Dictionary of property constraints
+        properties: Property constraints as (key, value) pairs; a dict is converted
         condition: Optional inline WHERE condition
         max_degree: Optional maximum degree constraint
         degree_direction: Optional relationship direction for degree constraint ("in", "out")
@@ -83,14 +87,21 @@ class NodePattern:
     """
     variable: Optional[str] = None
     labels: Union[Tuple[Union[str, BaseLabelExpr], ...], BaseLabelExpr, str] = ()
-    properties: Dict[str, Any] = field(default_factory=dict)
+    properties: Union[Tuple[Tuple[str, Any], ...], Dict[str, Any]] = ()
     condition: Optional[Expression] = None
     max_degree: Optional[int] = None
     degree_direction: Optional[str] = None
     degree_rel_type: Optional[str] = None
     _lazy_variable: Optional[str] = field(default=None, init=False, compare=False)
+    _apoc_condition: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+    _cypher_cache: Optional[Tuple[str, str]] = field(default=None, init=False, compare=False, repr=False)
 
     def __post_init__(self):
+        # Store properties as an immutable tuple of (key, value) pairs.
+        # Callers pass () rather than an empty dict, so only real dicts are converted
+        if isinstance(self.properties, dict):
+            object.__setattr__(self, "properties", tuple(self.properties.items()))
+        
         # Convert single string label to tuple
         if isinstance(self.labels, str):
             object.__setattr__(self, "labels", (self.labels,))
@@ -122,6 +133,24 @@ class NodePattern:
         # Validate degree constraints at creation time
         self._validate_degree_params()
         
+        # Build the APOC degree condition once, since all of its inputs are fixed
+        if self.max_degree is not None:
+            # Determine APOC function based on direction
+            if self.degree_direction == "in":
+                func_name = "apoc.node.degree.in"
+            elif self.degree_direction == "out":
+                func_name = "apoc.node.degree.out"
+            else:
+                func_name = "apoc.node.degree"
+            
+            # Build function arguments (variable is guaranteed by validation)
+            args = [self.variable]
+            if self.degree_rel_type:
+                args.append(f"'{self.degree_rel_type}'")
+                
+            apoc_call = f"{func_name}({', '.join(args)}) < {self.max_degree}"
+            object.__setattr__(self, "_apoc_condition", apoc_call)
+        
         # If variable is provided, ensure it's not treated as part of the label expression
         # This was causing issues like (:`(p & Person)`) instead of (p:Person)
         # We'll remove this conversion and handle variables separately in to_cypher
@@ -141,7 +170,11 @@ class NodePattern:
             >>> adult = person.where(prop("p", "age") > 18)
             >>> # Generates: (p:Person WHERE p.age > 18)
         """
-        return replace(self, condition=condition)
+        # Construct directly rather than through dataclasses.replace
+        return NodePattern(
+            self.variable, self.labels, self.properties, condition,
+            self.max_degree, self.degree_direction, self.degree_rel_type,
+        )
     
     def _ensure_variable(self) -> str:
         """
@@ -157,7 +190,8 @@ class NodePattern:
         if self._lazy_variable is not None:
             return self._lazy_variable
         
-        # Generate new variable and store it
+        # Generate new variable and store it. Renderings made before this point
+        # were never cached (see note_unresolved_render), so none go stale
         generated = _get_next_variable_name()
         object.__setattr__(self, '_lazy_variable', generated)
         return generated
@@ -184,8 +218,6 @@ class NodePattern:
         """
         variable_name = self._ensure_variable()
         
-        # Import locally to avoid circular import issues
-        from ..expressions import Property
         return Property(variable_name, property_name)
     
     def __str__(self) -> str:
@@ -222,7 +254,7 @@ class NodePattern:
                     "max_degree must be provided when using degree constraints"
                 )
     
-    
+    @cached_cypher
     def to_cypher(self) -> str:
         """
         Convert node pattern to Cypher string.
@@ -234,64 +266,45 @@ class NodePattern:
             >>> node("Person").where(prop("age") > 18).to_cypher()
             >>> # Returns: "(:Person WHERE age > 18)"
         """
-        parts = []
-        
-        # Handle variable and labels separately
-        cypher_parts = []
-        
         # Use lazy variable if it exists, otherwise use original variable (which may be None)
-        effective_variable = None
-        if self.variable is not None:
-            effective_variable = self.variable
-        elif self._lazy_variable is not None:
-            effective_variable = self._lazy_variable
-            
-        # Combine variable and labels
-        label_parts = []
+        effective_variable = self.variable if self.variable is not None else self._lazy_variable
+        if effective_variable is None:
+            # May still be named lazily, so this rendering must not be cached
+            note_unresolved_render()
+        
+        # Collect the pieces and join them once: "(var:Labels {props} WHERE cond)"
+        parts = ["("]
         
         # Add variable if present
         if effective_variable:
-            label_parts.append(effective_variable)
+            parts.append(effective_variable)
         
-        # Add labels with proper formatting
+        # Add labels with proper formatting; anonymous nodes with labels get a
+        # leading colon too (:Person)
         if self.labels:
             if isinstance(self.labels, BaseLabelExpr):
                 labels_str = str(self.labels)
                 # Wrap complex expressions in backticks if they contain operators
-                if any(op in labels_str for op in ["&", "|", "!"]):
+                if not _LABEL_OPS.isdisjoint(labels_str):
                     labels_str = f"`{labels_str}`"
-                label_parts.append(labels_str)
             elif isinstance(self.labels, tuple):
                 # Handle tuple of labels - join with colons for multiple labels
-                labels_str = ":".join(str(label) for label in self.labels)
-                label_parts.append(labels_str)
+                labels_str = ":".join([str(label) for label in self.labels])
             else:
                 # Handle single string label (fallback)
                 labels_str = str(self.labels)
-                label_parts.append(labels_str)
-        
-        # Join with colons, handling the anonymous case
-        if label_parts:
-            if effective_variable:
-                # Has variable: join with colons (p:Person or p)
-                label_str = ":".join(label_parts)
-            else:
-                # Anonymous with labels: prepend colon (:Person)
-                label_str = ":" + ":".join(label_parts)
-        else:
-            # No variable or labels (shouldn't happen)
-            label_str = ""
+            parts.append(":")
+            parts.append(labels_str)
         
         # Add properties
-        properties_str = ""
         if self.properties:
-            props = ", ".join(f"{k}: {format_value(v)}" for k, v in self.properties.items())
-            properties_str = f" {{{props}}}"
+            fv = format_value
+            parts.append(" {")
+            parts.append(", ".join([f"{k}: {fv(v)}" for k, v in self.properties]))
+            parts.append("}")
         
         # Add inline WHERE condition
         # Validation already happened in __post_init__
-        
-        condition_str = ""
         conditions: list[str] = []  # Explicit type declaration
         
         # Add existing condition if present
@@ -301,29 +314,16 @@ class NodePattern:
                 conditions.append(cypher_str)
             
         # Add APOC degree condition if needed
-        if self.max_degree is not None:
-            # Determine APOC function based on direction
-            if self.degree_direction == "in":
-                func_name = "apoc.node.degree.in"
-            elif self.degree_direction == "out":
-                func_name = "apoc.node.degree.out"
-            else:
-                func_name = "apoc.node.degree"
-            
-            # Build function arguments
-            args = [effective_variable]
-            if self.degree_rel_type:
-                args.append(f"'{self.degree_rel_type}'")
-                
-            apoc_call = f"{func_name}({', '.join(args)}) < {self.max_degree}"
-            conditions.append(apoc_call)
+        if self._apoc_condition is not None:
+            conditions.append(self._apoc_condition)
         
-        # Combine all conditions, filtering out any None values
+        # Combine all conditions
         if conditions:
-            valid_conditions = [c for c in conditions if c is not None]
-            condition_str = " WHERE " + " AND ".join(valid_conditions)
+            parts.append(" WHERE ")
+            parts.append(" AND ".join(conditions))
         
-        return f"({label_str}{properties_str}{condition_str})"
+        parts.append(")")
+        return "".join(parts)
     
     def relationship(self, rel_type: str = "", direction: str = "-", variable: Optional[str] = None, **properties: Any) -> "PathPattern":
         """
@@ -344,24 +344,15 @@ class NodePattern:
             >>> # The path can be extended: path.node("f", "Person") 
             >>> # Generates: (p:Person)-[:KNOWS]->(f:Person)
         """
-        # Import locally to avoid circular dependency
-        from .relationship_pattern import RelationshipPattern
-        from .path_pattern import PathPattern
-        
         # Map direction to RelationshipPattern's internal representation
-        if direction in ("->", ">"):
-            direction = ">"
-        elif direction in ("<-", "<"):
-            direction = "<"
-        elif direction not in ("-", "--"):
-            direction = "-"
+        direction = _DIRECTION_ALIASES.get(direction, "-")
         
         # Create the relationship pattern
         rel = RelationshipPattern(
             direction=direction,
             variable=variable,
             type=rel_type,
-            properties=properties
+            properties=properties or ()
         )
         
         # Return a PathPattern containing both the node and the relationship
@@ -369,15 +360,19 @@ class NodePattern:
         
     def __add__(self, other: Union[NodePattern, RelationshipPattern, PathPattern]) -> PathPattern:  # Remove quotes around types
         """Enable operator overloading for path construction."""
-        # Import locally to avoid circular dependencies
-        from .relationship_pattern import RelationshipPattern
-        from .path_pattern import PathPattern
-        
-        if isinstance(other, NodePattern):
-            return PathPattern([self, other])  # Will automatically insert implicit relationship
-        elif isinstance(other, RelationshipPattern):
-            return PathPattern([self, other])
-        elif isinstance(other, PathPattern):
-            return PathPattern([self]).concat(other)
-        else:
+        handler = _find_add_handler(_ADD_DISPATCH, type(other))
+        if handler is None:
             raise TypeError(f"Cannot add NodePattern to {type(other)}")
+        return handler(self, other)
+
+
+# Handlers for NodePattern.__add__, keyed on the type of the right operand
+_ADD_DISPATCH = {
+    NodePattern: lambda node, other: PathPattern([node, other]),  # Will automatically insert implicit relationship
+    RelationshipPattern: lambda node, other: PathPattern([node, other]),
+    PathPattern: lambda node, other: PathPattern([node]).concat(other),
+}
+
+# RelationshipPattern.__add__ dispatches on NodePattern, which only exists
+# from here on; this module is always the last of the pattern modules to finish
+_init_relationship_add_dispatch()
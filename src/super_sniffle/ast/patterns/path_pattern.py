@@ -1,8 +1,9 @@
-from dataclasses import dataclass, field, replace
-from typing import Optional, Sequence, Union, TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, Union, TYPE_CHECKING, Any
 from ..expressions import Expression
+from ..formatting_utils import cached_cypher
 from .base_patterns import BasePathPattern
-from .types import PatternElement, NodeType, RelType
+from .types import PatternElement
 
 if TYPE_CHECKING:
     from .node_pattern import NodePattern
@@ -18,23 +19,36 @@ class PathPattern(BasePathPattern):
     a traversal pattern in the graph.
     
     Attributes:
-        elements: List of pattern elements (nodes, relationships, or paths)
+        elements: Tuple of pattern elements (nodes, relationships, or paths)
         variable: Optional variable name for the path
         condition: Optional WHERE condition for the entire path
     """
-    elements: Sequence[PatternElement]
+    elements: Tuple[PatternElement, ...]
     variable: Optional[str] = None
     condition: Optional[Expression] = None
+    # Paths have no precomputed anonymous form; only the render cache is used
+    _anonymous_cypher: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+    _cypher_cache: Optional[Tuple[str, str]] = field(default=None, init=False, compare=False, repr=False)
     
     def __post_init__(self):
         """Automatically insert implicit relationships between consecutive nodes only when necessary."""
-        # Import locally to avoid circular dependency
-        from .relationship_pattern import RelationshipPattern
-        from .node_pattern import NodePattern
+        # Skip the rewrite when there is nothing to flatten and no adjacent
+        # node/node or relationship/relationship pairs to fix up
+        elements = self.elements
+        node_cls = _node_pattern.NodePattern
+        rel_cls = _relationship_pattern.RelationshipPattern
+        if not any(isinstance(elem, PathPattern) for elem in elements) and not any(
+            (isinstance(a, node_cls) and isinstance(b, node_cls))
+            or (isinstance(a, rel_cls) and isinstance(b, rel_cls))
+            for a, b in zip(elements, elements[1:])
+        ):
+            if not isinstance(elements, tuple):
+                object.__setattr__(self, "elements", tuple(elements))
+            return
         
         # First, flatten any PathPattern elements
         flattened_elements = []
-        for elem in self.elements:
+        for elem in elements:
             if isinstance(elem, PathPattern):
                 flattened_elements.extend(elem.elements)
             else:
@@ -49,17 +63,18 @@ class PathPattern(BasePathPattern):
             # If current is a node and next exists, and next is also a node, then insert an implicit relationship
             if i < len(flattened_elements) - 1:
                 next_elem = flattened_elements[i+1]
-                if isinstance(current, NodePattern) and isinstance(next_elem, NodePattern):
+                if isinstance(current, node_cls) and isinstance(next_elem, node_cls):
                     # Insert implicit relationship: no variable, no type, undirected
-                    new_elements.append(RelationshipPattern(direction="-"))
-                elif isinstance(current, RelationshipPattern) and isinstance(next_elem, RelationshipPattern):
+                    new_elements.append(rel_cls.anonymous("-"))
+                elif isinstance(current, rel_cls) and isinstance(next_elem, rel_cls):
                     # Skip next element if it's a relationship since we shouldn't have two relationships in a row
                     i += 1
             i += 1
         
         # Update elements with implicit relationships
-        object.__setattr__(self, "elements", new_elements)
+        object.__setattr__(self, "elements", tuple(new_elements))
     
+    @cached_cypher
     def to_cypher(self) -> str:
         """
         Convert path pattern to Cypher string.
@@ -75,25 +90,10 @@ class PathPattern(BasePathPattern):
             >>> path.to_cypher()
             >>> # Returns: "p = (p1:Person)--(p2:Person)"
         """
-        # Import locally to avoid circular dependencies
-        from .node_pattern import NodePattern
-        from .relationship_pattern import RelationshipPattern
-        
         parts = []
         for elem in self.elements:
-            # Handle anonymous elements efficiently
-            if isinstance(elem, NodePattern) and elem.variable is None and not elem.labels and not elem.properties and elem.condition is None:
-                parts.append("()")
-            elif isinstance(elem, RelationshipPattern) and elem.variable is None and elem.type is None and not elem.properties and elem.condition is None:
-                # Handle anonymous relationships
-                if elem.direction == "<":
-                    parts.append("<--")
-                elif elem.direction == ">":
-                    parts.append("-->")
-                else:
-                    parts.append("--")
-            else:
-                parts.append(elem.to_cypher())
+            # Anonymous nodes and relationships carry their precomputed rendering
+            parts.append(getattr(elem, "_anonymous_cypher", None) or elem.to_cypher())
                 
         path_str = "".join(parts)
         if self.variable:
@@ -108,7 +108,7 @@ class PathPattern(BasePathPattern):
         
     def as_(self, variable: str) -> 'PathPattern':
         """Assign the path to a variable"""
-        return replace(self, variable=variable)
+        return PathPattern(self.elements, variable, self.condition)
 
     def where(self, condition: Expression) -> 'PathPattern':
         """
@@ -123,11 +123,10 @@ class PathPattern(BasePathPattern):
         Raises:
             ValueError: If attempting to add condition to an incomplete path
         """
-        from .relationship_pattern import RelationshipPattern  # Import to avoid circular dependency
         # Cannot add condition to incomplete path (ending with relationship)
-        if self.elements and isinstance(self.elements[-1], RelationshipPattern):
+        if self.elements and isinstance(self.elements[-1], _relationship_pattern.RelationshipPattern):
             raise ValueError("Cannot add condition to incomplete path")
-        return replace(self, condition=condition)
+        return PathPattern(self.elements, self.variable, condition)
 
     def quantify(self, min_hops: Optional[int] = None, max_hops: Optional[int] = None) -> "QuantifiedPathPattern":
         """
@@ -140,7 +139,6 @@ class PathPattern(BasePathPattern):
         Returns:
             A QuantifiedPathPattern object.
         """
-        from .quantified_path_pattern import QuantifiedPathPattern  # Import to avoid circular dependency
         if min_hops is None and max_hops is None:
             raise ValueError("At least one of min_hops or max_hops must be specified.")
         
@@ -148,21 +146,19 @@ class PathPattern(BasePathPattern):
             raise ValueError("min_hops cannot be greater than max_hops.")
 
         quantifier = f"{{{min_hops or ''}, {max_hops or ''}}}"
-        return QuantifiedPathPattern(self, quantifier)
+        return _quantified_path_pattern.QuantifiedPathPattern(self, quantifier)
 
     def one_or_more(self) -> "QuantifiedPathPattern":
         """
         Applies a '+' quantifier to the path pattern (one or more hops).
         """
-        from .quantified_path_pattern import QuantifiedPathPattern  # Import to avoid circular dependency
-        return QuantifiedPathPattern(self, "+")
+        return _quantified_path_pattern.QuantifiedPathPattern(self, "+")
 
     def zero_or_more(self) -> "QuantifiedPathPattern":
         """
         Applies a '*' quantifier to the path pattern (zero or more hops).
         """
-        from .quantified_path_pattern import QuantifiedPathPattern  # Import to avoid circular dependency
-        return QuantifiedPathPattern(self, "*")
+        return _quantified_path_pattern.QuantifiedPathPattern(self, "*")
     
     def concat(self, other: Union['PathPattern', 'NodePattern', 'RelationshipPattern']) -> 'PathPattern':
         """
@@ -183,10 +179,6 @@ class PathPattern(BasePathPattern):
         Raises:
             ValueError: If trying to append a relationship to a path ending with a relationship
         """
-        # Local imports to avoid circular dependencies
-        from .node_pattern import NodePattern
-        from .relationship_pattern import RelationshipPattern
-        
         if not self.elements:
             if isinstance(other, PathPattern):
                 return other
@@ -199,21 +191,46 @@ class PathPattern(BasePathPattern):
             other = PathPattern([other])
             
         # Check for invalid concatenation: path ending with relationship + relationship
-        if isinstance(self.elements[-1], RelationshipPattern) and other.elements:
-            if isinstance(other.elements[0], RelationshipPattern):
+        node_cls = _node_pattern.NodePattern
+        rel_cls = _relationship_pattern.RelationshipPattern
+        if isinstance(self.elements[-1], rel_cls) and other.elements:
+            if isinstance(other.elements[0], rel_cls):
                 raise ValueError("Cannot append a relationship to a path ending with a relationship")
             
-        # Skip duplicate node if last of first path and first of second path are the same node
+        # Skip duplicate node if last of first path and first of second path are the same node.
+        # Continuing from the very same instance is the common builder case, so check
+        # identity first (two relationships were already rejected above)
         last_elem = self.elements[-1]
         first_elem = other.elements[0]
-        if (isinstance(last_elem, NodePattern) and 
-            isinstance(first_elem, NodePattern) and 
-            last_elem.variable == first_elem.variable):
-            new_elements = list(self.elements) + list(other.elements[1:])
+        if last_elem is first_elem:
+            new_elements = self.elements + other.elements[1:]
+        elif isinstance(last_elem, node_cls) and isinstance(first_elem, node_cls):
+            if last_elem.variable == first_elem.variable:
+                new_elements = self.elements + other.elements[1:]
+            else:
+                # Two distinct nodes meet: insert the implicit relationship here
+                new_elements = self.elements + (rel_cls.anonymous("-"),) + other.elements
         else:
-            new_elements = list(self.elements) + list(other.elements)
+            new_elements = self.elements + other.elements
             
-        return PathPattern(new_elements, variable=self.variable)
+        # Both sides are already normalized and the junction has been handled
+        return PathPattern._from_normalized(new_elements, variable=self.variable)
+    
+    @classmethod
+    def _from_normalized(cls, elements: Tuple[PatternElement, ...], variable: Optional[str] = None) -> 'PathPattern':
+        """
+        Build a path from elements that need no flattening or implicit relationships.
+        
+        Bypasses ``__post_init__``; callers must guarantee the elements contain no
+        nested paths and no adjacent node/node or relationship/relationship pairs.
+        """
+        path = cls.__new__(cls)
+        object.__setattr__(path, "elements", elements)
+        object.__setattr__(path, "variable", variable)
+        object.__setattr__(path, "condition", None)
+        object.__setattr__(path, "_anonymous_cypher", None)
+        object.__setattr__(path, "_cypher_cache", None)
+        return path
         
     def node(self, *labels: str, variable: Optional[str] = None, **properties: Any) -> 'PathPattern':
         """
@@ -227,8 +244,7 @@ class PathPattern(BasePathPattern):
         Returns:
             New PathPattern with the node appended
         """
-        from .node_pattern import NodePattern
-        return self.concat(NodePattern(variable, labels, properties))
+        return self.concat(_node_pattern.NodePattern(variable, labels, properties or ()))
     
     def __add__(self, other: Union['PathPattern', 'NodePattern', 'RelationshipPattern']) -> 'PathPattern':
         """
@@ -243,3 +259,10 @@ class PathPattern(BasePathPattern):
             A new PathPattern representing the concatenated path.
         """
         return self.concat(other)
+
+
+# Imported once PathPattern exists: these modules import it in turn. Classes
+# from them are looked up on the module at call time, when all are loaded.
+from . import node_pattern as _node_pattern  # noqa: E402
+from . import relationship_pattern as _relationship_pattern  # noqa: E402
+from . import quantified_path_pattern as _quantified_path_pattern  # noqa: E402
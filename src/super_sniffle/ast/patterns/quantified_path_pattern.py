@@ -1,6 +1,9 @@
-from dataclasses import dataclass, replace
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+from ..formatting_utils import cached_cypher
 from .path_pattern import PathPattern
+# Imports this module in turn; RelationshipPattern is looked up at call time
+from . import relationship_pattern as _relationship_pattern
 
 @dataclass(frozen=True)
 class QuantifiedPathPattern:
@@ -15,19 +18,25 @@ class QuantifiedPathPattern:
     path: PathPattern
     quantifier: str
     variable: Optional[str] = None
+    _needs_wrap: bool = field(default=True, init=False, compare=False, repr=False)
+    _anonymous_cypher: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+    _cypher_cache: Optional[Tuple[str, str]] = field(default=None, init=False, compare=False, repr=False)
 
+    def __post_init__(self):
+        # For single relationship patterns, don't wrap in parentheses
+        elements = self.path.elements
+        if len(elements) == 1 and isinstance(elements[0], _relationship_pattern.RelationshipPattern):
+            object.__setattr__(self, "_needs_wrap", False)
+
+    @cached_cypher
     def to_cypher(self) -> str:
         """
         Converts the quantified path pattern to a Cypher string.
         """
-        # For single relationship patterns, don't wrap in parentheses
-        # Use string type check to avoid circular imports
-        if len(self.path.elements) == 1 and self.path.elements[0].__class__.__name__ == 'RelationshipPattern':
-            base = self.path.to_cypher()
+        if self._needs_wrap:
+            base = f"({self.path.to_cypher()}){self.quantifier}"
         else:
-            base = f"({self.path.to_cypher()})"
-        
-        base += self.quantifier
+            base = self.path.to_cypher() + self.quantifier
         
         if self.variable:
             return f"{self.variable} = {base}"
@@ -35,4 +44,4 @@ class QuantifiedPathPattern:
         
     def as_(self, variable: str) -> 'QuantifiedPathPattern':
         """Assign the quantified path to a variable"""
-        return replace(self, variable=variable)
+        return QuantifiedPathPattern(self.path, self.quantifier, variable)
@@ -1,16 +1,73 @@
-from dataclasses import dataclass, field, replace
-from typing import Optional, Union, Dict, Any, TYPE_CHECKING
+from dataclasses import field
+from functools import lru_cache
+from typing import Optional, Tuple, Union, Dict, Any, Callable, Literal, TYPE_CHECKING
 from ..expressions import Expression
+from .path_pattern import PathPattern
 from .quantified_path_pattern import QuantifiedPathPattern
-from super_sniffle.ast.formatting_utils import format_value
-from .types import NodeType, PathType
+# Imports this module in turn; NodePattern is looked up at call time
+from . import node_pattern as _node_pattern
+from super_sniffle.ast.formatting_utils import format_value, cached_cypher
+from super_sniffle.utils.dataclass import fast_frozen_dataclass
 
 if TYPE_CHECKING:
-    from .base_patterns import BasePathPattern
     from .node_pattern import NodePattern
-    from .path_pattern import PathPattern
 
-@dataclass(frozen=True)
+# Internal representation of a relationship direction
+Direction = Literal["<", ">", "-"]
+
+# Accepted spellings of each direction, mapped to the internal representation
+_DIRECTION_ALIASES: Dict[str, Direction] = {
+    "->": ">", ">": ">",
+    "<-": "<", "<": "<",
+    "-": "-", "--": "-",
+}
+
+# Brackets around relationship content, and the bare form without content
+_WRAP: Dict[Direction, Tuple[str, str]] = {"<": ("<-[", "]-"), ">": ("-[", "]->"), "-": ("-[", "]-")}
+_SHORTHAND: Dict[Direction, str] = {"<": "<--", ">": "-->", "-": "--"}
+
+# Handlers for RelationshipPattern.__add__, keyed on the type of the
+# right operand. Filled once by node_pattern, after NodePattern is defined.
+_ADD_DISPATCH: Dict[type, Callable[[Any, Any], 'PathPattern']] = {}
+
+
+def _init_add_dispatch() -> None:
+    """Populate the ``__add__`` dispatch table."""
+    _ADD_DISPATCH[_node_pattern.NodePattern] = lambda rel, other: PathPattern([rel, other])
+    # Create a temporary PathPattern containing just this relationship
+    # and concatenate the other path onto it
+    _ADD_DISPATCH[PathPattern] = lambda rel, other: PathPattern([rel]).concat(other)
+
+
+@lru_cache(maxsize=128)
+def _quantifier(min_hops: Optional[int], max_hops: Optional[int]) -> str:
+    """Build the ``{min,max}`` quantifier string, keeping 0 as an explicit bound."""
+    if min_hops is None and max_hops is None:
+        raise ValueError("At least one of min_hops or max_hops must be specified")
+    
+    min_str = str(min_hops) if min_hops is not None else ''
+    max_str = str(max_hops) if max_hops is not None else ''
+    return f"{{{min_str},{max_str}}}"
+
+
+def _find_add_handler(table: Dict[type, Callable], other_type: type) -> Optional[Callable]:
+    """
+    Look up an ``__add__`` handler for the type of the right operand.
+    
+    Exact types are a single dict lookup. Subclasses fall back to their MRO
+    and the result is stored under the subclass for the next call.
+    """
+    handler = table.get(other_type)
+    if handler is None:
+        for base in other_type.__mro__[1:]:
+            handler = table.get(base)
+            if handler is not None:
+                table[other_type] = handler
+                break
+    return handler
+
+
+@fast_frozen_dataclass(slots=True)
 class RelationshipPattern:
     """
     Represents a relationship pattern in a Cypher query.
@@ -21,16 +78,60 @@ class RelationshipPattern:
         direction: Relationship direction ("<", ">", or "-" for undirected)
         variable: Optional variable name for the relationship
         type: Optional relationship type (e.g., "KNOWS")
-        properties: Dictionary of property constraints
+        properties: Property constraints as (key, value) pairs; a dict is converted
         condition: Optional inline WHERE condition
         start_node: Optional reference to start node (for API chaining)
     """
-    direction: str  # "<", ">", or "-" for undirected
+    direction: Direction  # "<", ">", or "-" for undirected; other spellings are normalized
     variable: Optional[str] = None
     type: Optional[str] = None
-    properties: Dict[str, Any] = field(default_factory=dict)
+    properties: Union[Tuple[Tuple[str, Any], ...], Dict[str, Any]] = ()
     condition: Optional[Expression] = None
     start_node: Optional['NodePattern'] = field(default=None, compare=False)  # Not part of pattern identity
+    _props_cypher: str = field(default="", init=False, compare=False, repr=False)
+    _anonymous_cypher: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+    _cypher_cache: Optional[Tuple[str, str]] = field(default=None, init=False, compare=False, repr=False)
+    
+    def __post_init__(self):
+        # Normalize the direction so the rendering tables can be indexed directly
+        if self.direction not in _SHORTHAND:
+            object.__setattr__(self, "direction", _DIRECTION_ALIASES.get(self.direction, "-"))
+        
+        # Store properties as an immutable tuple of (key, value) pairs.
+        # Callers pass () rather than an empty dict, so only real dicts are converted
+        if isinstance(self.properties, dict):
+            object.__setattr__(self, "properties", tuple(self.properties.items()))
+        
+        # Properties never change, so render the {key: value} map once
+        if self.properties:
+            fv = format_value
+            props_str = ", ".join([f"{k}: {fv(v)}" for k, v in self.properties])
+            object.__setattr__(self, "_props_cypher", f"{{{props_str}}}")
+        
+        # Precompute the rendering of a fully anonymous relationship
+        if (self.variable is None and not self.type and
+                not self.properties and self.condition is None):
+            object.__setattr__(self, "_anonymous_cypher", _SHORTHAND[self.direction])
+    
+    @classmethod
+    def anonymous(cls, direction: str = "-") -> 'RelationshipPattern':
+        """
+        Return the shared anonymous relationship for a direction.
+        
+        Anonymous relationships carry no variable, type, properties or
+        condition, so a single immutable instance per direction is reused.
+        
+        Args:
+            direction: Relationship direction ("<", ">", or "-" for undirected)
+            
+        Returns:
+            The canonical RelationshipPattern for that direction
+            
+        Example:
+            >>> RelationshipPattern.anonymous(">").to_cypher()
+            >>> # Returns: "-->"
+        """
+        return _ANONYMOUS[_DIRECTION_ALIASES.get(direction, "-")]
     
     def node(self, *labels: str, variable: Optional[str] = None, **properties: Any) -> 'PathPattern':
         """
@@ -49,13 +150,10 @@ class RelationshipPattern:
             >>> path = person.relationship("KNOWS", ">").node("f", "Person")
             >>> # Generates: (p:Person)-[:KNOWS]->(f:Person)
         """
-        from .node_pattern import NodePattern
-        from .path_pattern import PathPattern
-        
         if not self.start_node:
             raise ValueError("RelationshipPattern missing start_node reference")
             
-        end_node = NodePattern(variable, labels, properties)
+        end_node = _node_pattern.NodePattern(variable, labels, properties or ())
         return PathPattern([self.start_node, self, end_node])
     
     def where(self, condition: Expression) -> 'RelationshipPattern':
@@ -73,8 +171,14 @@ class RelationshipPattern:
             >>> recent = knows.where(prop("r", "since") > 2020)
             >>> # Generates: -[r:KNOWS WHERE r.since > 2020]->
         """
-        return replace(self, condition=condition)
+        # Construct directly rather than through dataclasses.replace, which
+        # inspects fields() and builds a kwargs dict on every call
+        return RelationshipPattern(
+            self.direction, self.variable, self.type, self.properties, condition,
+            start_node=self.start_node,
+        )
     
+    @cached_cypher
     def to_cypher(self) -> str:
         """
         Convert relationship pattern to Cypher string.
@@ -86,57 +190,37 @@ class RelationshipPattern:
             >>> relationship(">", "r", "KNOWS").where(prop("r", "since") > 2020).to_cypher()
             >>> # Returns: "-[r:KNOWS WHERE r.since > 2020]->"
         """
-        # Build relationship content
-        rel_content = ""
+        # Fully anonymous relationships are answered by cached_cypher from
+        # _anonymous_cypher and never reach this point
         
-        if self.variable:
-            rel_content += self.variable
+        # Build relationship content: "var:TYPE {props} WHERE cond"
+        parts = []
         
         if self.type:
             # Always include colon before relationship type
-            rel_content += ":" + self.type
+            parts.append(f"{self.variable or ''}:{self.type}")
+        elif self.variable:
+            parts.append(self.variable)
         
-        if self.properties:
-            props_str = ", ".join(f"{k}: {format_value(v)}" 
-                                for k, v in self.properties.items())
-            # Add space if there's existing content
-            if rel_content:
-                rel_content += " "
-            rel_content += f"{{{props_str}}}"
+        if self._props_cypher:
+            parts.append(self._props_cypher)
         
         # Add inline WHERE condition
         if self.condition:
-            # Add space if there's existing content
-            if rel_content:
-                rel_content += " "
-            rel_content += f"WHERE {self.condition.to_cypher()}"
+            parts.append(f"WHERE {self.condition.to_cypher()}")
         
         # Build the relationship string
-        if self.direction == "<":
-            if rel_content:
-                return f"<-[{rel_content}]-"
-            return "<--"
-        elif self.direction == ">":
-            if rel_content:
-                return f"-[{rel_content}]->"
-            return "-->"
-        else:
-            if rel_content:
-                return f"-[{rel_content}]-"
-            return "--"
+        if not parts:
+            return _SHORTHAND[self.direction]
+        left, right = _WRAP[self.direction]
+        return f"{left}{' '.join(parts)}{right}"
 
     def __add__(self, other: Union['NodePattern', 'PathPattern']) -> 'PathPattern':
         """Enable operator overloading for path construction."""
-        from .path_pattern import PathPattern  # Local import to avoid circular dependency
-        if other.__class__.__name__ == 'NodePattern':
-            return PathPattern([self, other])
-        elif other.__class__.__name__ == 'PathPattern':
-            # Create a temporary PathPattern containing just this relationship
-            temp_path = PathPattern([self])
-            # Concatenate with the other path
-            return temp_path.concat(other)
-        else:
+        handler = _find_add_handler(_ADD_DISPATCH, type(other))
+        if handler is None:
             raise TypeError(f"Cannot add RelationshipPattern to {type(other)}")
+        return handler(self, other)
             
     def quantify(self, min_hops: Optional[int] = None, max_hops: Optional[int] = None) -> "QuantifiedPathPattern":
         """
@@ -155,15 +239,11 @@ class RelationshipPattern:
             >>> relationship(">", "KNOWS").quantify(1, 5)
             -[:KNOWS]->{1,5}
         """
-        from .path_pattern import PathPattern  # Import to avoid circular dependency
-        # Create quantifier string with proper 0 handling
-        if min_hops is None and max_hops is None:
-            raise ValueError("At least one of min_hops or max_hops must be specified")
-        
-        min_str = str(min_hops) if min_hops is not None else ''
-        max_str = str(max_hops) if max_hops is not None else ''
-        quantifier = f"{{{min_str},{max_str}}}"
-        
         # Create a path pattern containing just this relationship
-        path_pattern = PathPattern([self])
-        return QuantifiedPathPattern(path_pattern, quantifier)
+        return QuantifiedPathPattern(PathPattern([self]), _quantifier(min_hops, max_hops))
+
+
+# Canonical anonymous relationships, shared by RelationshipPattern.anonymous()
+_ANONYMOUS: Dict[Direction, RelationshipPattern] = {
+    direction: RelationshipPattern(direction=direction) for direction in ("<", ">", "-")
+}
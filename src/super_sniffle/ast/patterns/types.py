@@ -3,7 +3,6 @@ Common types to break circular dependencies in pattern classes.
 """
 
 from typing import TYPE_CHECKING, Union, TypeAlias
-from ..expressions import Expression
 
 if TYPE_CHECKING:
     from .node_pattern import NodePattern
@@ -7,12 +7,15 @@ types of Cypher clauses such as MATCH, WHERE, RETURN, ORDER BY, etc.
 
 from .clause import Clause
 from .match import MatchClause
+from .optional_match import OptionalMatchClause
 from .where import WhereClause
 from .return_ import ReturnClause
 from .with_ import WithClause
+from .group_by import GroupByClause
 from .order_by import OrderByClause
 from .limit import LimitClause
 from .skip import SkipClause
+from .unwind import UnwindClause
 from .call_subquery import CallSubqueryClause
 from .use import UseClause
 from .call_procedure import CallProcedureClause
@@ -20,13 +23,17 @@ from .yield_ import YieldClause
 from .next_ import NextClause
 
 __all__ = [
+    "Clause",
     "MatchClause",
+    "OptionalMatchClause",
     "WhereClause",
     "ReturnClause",
     "WithClause",
+    "GroupByClause",
     "OrderByClause",
     "LimitClause",
     "SkipClause",
+    "UnwindClause",
     "CallSubqueryClause",
     "UseClause",
     "CallProcedureClause",
@@ -1,61 +1,64 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Union, TYPE_CHECKING
+from dataclasses import field
+from typing import Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 from super_sniffle.ast.expressions.expression import Expression
+from super_sniffle.ast.formatting_utils import cached_cypher
 from super_sniffle.clauses.clause import Clause
+from super_sniffle.utils.dataclass import fast_frozen_dataclass
 
 if TYPE_CHECKING:
     from .yield_ import YieldClause
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class CallProcedureClause(Clause):
     """
     AST representation of a CALL procedure clause for invoking database procedures.
     
     Attributes:
         procedure_name: Name of the procedure to call (e.g., 'db.labels')
-        arguments: List of arguments to pass to the procedure
+        arguments: Arguments to pass to the procedure, stored as a tuple
         optional: Whether this is an OPTIONAL CALL
         yield_clause: Optional YIELD clause for handling procedure output
     """
+    # Clause keyword indexed by the optional flag
+    _KEYWORDS = ("CALL ", "OPTIONAL CALL ")
+    
     procedure_name: str
-    arguments: List[Union[str, Expression]] = field(default_factory=list)
+    arguments: Union[Tuple[Union[str, Expression], ...], Sequence[Union[str, Expression]]] = ()
     optional: bool = False
     yield_clause: Optional['YieldClause'] = None
+    _call_cypher: str = field(default="", init=False, compare=False, repr=False)
 
     def __post_init__(self):
         """Validate procedure name and arguments."""
         if not self.procedure_name:
             raise ValueError("Procedure name cannot be empty")
         
-        # Validate that all arguments are either strings or Expressions
+        # Store arguments as an immutable tuple; the default () is shared
+        if type(self.arguments) is not tuple:
+            object.__setattr__(self, "arguments", tuple(self.arguments))
+        
+        # Validate and render the arguments once; they cannot change afterwards
+        formatted = []
         for arg in self.arguments:
-            if not isinstance(arg, (str, Expression)):
+            if isinstance(arg, str):
+                formatted.append(f"'{arg}'")  # Wrap strings in single quotes
+            elif isinstance(arg, Expression):
+                formatted.append(arg.to_cypher())
+            else:
                 raise TypeError(f"Procedure arguments must be strings or Expressions, got {type(arg)}")
+        
+        # Everything but the YIELD clause is fixed at construction
+        object.__setattr__(
+            self, "_call_cypher",
+            f"{self._KEYWORDS[self.optional]}{self.procedure_name}({', '.join(formatted)})",
+        )
 
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """Generates Cypher representation of the CALL procedure clause."""
-        prefix = indent if indent is not None else ""
-        
-        # Build OPTIONAL CALL if specified
-        call_keyword = "OPTIONAL CALL" if self.optional else "CALL"
-        
-        # Build arguments string
-        def format_arg(arg):
-            if isinstance(arg, str):
-                return f"'{arg}'"  # Wrap strings in single quotes
-            elif isinstance(arg, Expression):
-                return arg.to_cypher()
-            return str(arg)
-        
-        args_str = ", ".join(format_arg(arg) for arg in self.arguments)
-        
-        # Build the base CALL clause
-        cypher = f"{prefix}{call_keyword} {self.procedure_name}({args_str})"
-        
         # Append YIELD clause if present
         if self.yield_clause:
-            cypher += "\n" + self.yield_clause.to_cypher(indent)
-            
-        return cypher
+            return f"{indent}{self._call_cypher}\n{self.yield_clause.to_cypher(indent)}"
+        return indent + self._call_cypher
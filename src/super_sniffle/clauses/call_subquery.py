@@ -5,13 +5,15 @@ This module implements the CALL subquery functionality that allows running
 subqueries with variable scoping in Neo4j Cypher.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Union, Any
+from dataclasses import field
+from typing import List, Optional, Tuple, Union, Any
 
-from .clause import Clause
+from ..ast.formatting_utils import cached_cypher
+from .clause import KIND_PROJECTION, Clause
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class CallSubqueryClause(Clause):
     """
     Represents a CALL subquery clause in a Cypher query.
@@ -27,40 +29,50 @@ class CallSubqueryClause(Clause):
         variables: Variable scoping specification:
             - None: CALL() - no variables
             - "*": CALL(*) - all variables
-            - List[str]: CALL(var1, var2) - specific variables
+            - List[str]: CALL(var1, var2) - specific variables (stored as a tuple)
         optional: Whether to make this an OPTIONAL CALL
     """
+    _KIND = KIND_PROJECTION
+    # Clause keyword indexed by the optional flag
+    _KEYWORDS = ("CALL", "OPTIONAL CALL")
+    
     subquery: Any  # QueryBuilder - avoiding circular import
-    variables: Optional[Union[str, List[str]]] = None
+    variables: Optional[Union[str, List[str], Tuple[str, ...]]] = None
     optional: bool = False
 
-    def to_cypher(self, indent: Optional[str] = None) -> str:
-        """
-        Convert the CALL subquery clause to a Cypher string.
+    _header: str = field(default="", init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        # Store a variable list as a tuple so the clause stays hashable
+        if isinstance(self.variables, list):
+            object.__setattr__(self, "variables", tuple(self.variables))
         
-        Args:
-            indent: Optional indentation prefix for each line
-            
-        Returns:
-            Cypher string representation of the CALL subquery
-        """
-        prefix = indent if indent is not None else ""
         # Build the variable scoping part
-        if self.variables is None or (isinstance(self.variables, list) and len(self.variables) == 0):
+        if self.variables is None or (isinstance(self.variables, tuple) and len(self.variables) == 0):
             var_scope = "()"
         elif self.variables == "*":
             var_scope = "(*)"
         elif isinstance(self.variables, str):
             var_scope = f"({self.variables})"
-        elif isinstance(self.variables, list):
+        elif isinstance(self.variables, tuple):
             var_scope = f"({', '.join(self.variables)})"
         else:
             var_scope = ""
         
-        # Get the subquery Cypher with proper indentation
-        body_indent = prefix + "  " if prefix else "  "
-        body = self.subquery.to_cypher(indent=body_indent)
+        # Everything before the body is fixed at construction
+        object.__setattr__(self, "_header", f"{self._KEYWORDS[self.optional]}{var_scope} {{\n")
+
+    @cached_cypher
+    def to_cypher(self, indent: Optional[str] = None) -> str:
+        """
+        Convert the CALL subquery clause to a Cypher string.
         
-        # Format the CALL clause
-        call_keyword = "OPTIONAL CALL" if self.optional else "CALL"
-        return f"{prefix}{call_keyword}{var_scope} {{\n{body}\n{prefix}}}"
+        Args:
+            indent: Optional indentation prefix for each line
+            
+        Returns:
+            Cypher string representation of the CALL subquery
+        """
+        # Get the subquery Cypher with proper indentation
+        body = self.subquery.to_cypher(indent=indent + "  ")
+        return f"{indent}{self._header}{body}\n{indent}}}"
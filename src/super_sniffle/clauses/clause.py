@@ -1,10 +1,25 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import field
+from typing import Optional, Tuple
 
+from ..utils.dataclass import fast_frozen_dataclass
 
-@dataclass(frozen=True)
+# Clause kinds, tagged on each clause class so that QueryBuilder can sort
+# clauses into their rendering buckets without an isinstance chain
+KIND_OTHER = 0
+KIND_ORDER_BY = 1
+KIND_SKIP = 2
+KIND_LIMIT = 3
+KIND_PROJECTION = 4
+
+
+@fast_frozen_dataclass(slots=True)
 class Clause:
     """Base class for all Cypher clauses."""
+    _KIND = KIND_OTHER
+    
+    _cypher_cache: Optional[Tuple[str, str]] = field(
+        default=None, init=False, compare=False, repr=False
+    )
 
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
@@ -1,19 +1,32 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import field
+from typing import Optional, Sequence, Tuple, Union
 
+from ..ast.formatting_utils import cached_cypher
 from .clause import Clause
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class GroupByClause(Clause):
     """
     Represents a GROUP BY clause in a Cypher query.
     """
-    expressions: List[str]
+    expressions: Union[Tuple[str, ...], Sequence[str]]
+    _expressions_cypher: str = field(default="", init=False, compare=False, repr=False)
 
+    def __post_init__(self):
+        # Store expressions as a tuple so the clause is hashable
+        if type(self.expressions) is not tuple:
+            object.__setattr__(self, "expressions", tuple(self.expressions))
+        # The clause is frozen, so the expressions can be joined once; a
+        # single grouping key is used as-is
+        expressions = self.expressions
+        rendered = expressions[0] if len(expressions) == 1 else ", ".join(expressions)
+        object.__setattr__(self, "_expressions_cypher", rendered)
+
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
         Convert the GROUP BY clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        return f"{prefix}GROUP BY {', '.join(self.expressions)}"
+        return indent + "GROUP BY " + self._expressions_cypher
@@ -1,19 +1,30 @@
-from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import Optional, Tuple, Union
 
+from ..ast.formatting_utils import cached_cypher
 from .clause import Clause
 from ..ast.patterns import NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class MatchClause(Clause):
     """Represents a MATCH clause in a Cypher query."""
-    patterns: List[Union[NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern]]
+    patterns: Tuple[Union[NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern], ...]
 
+    def __post_init__(self):
+        # Store patterns as a tuple; the API already passes its *patterns tuple
+        if type(self.patterns) is not tuple:
+            object.__setattr__(self, "patterns", tuple(self.patterns))
+
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
         Convert the MATCH clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        pattern_str = ", ".join(pattern.to_cypher() for pattern in self.patterns)
-        return f"{prefix}MATCH {pattern_str}"
+        patterns = self.patterns
+        if len(patterns) == 1:
+            # The common single-pattern MATCH needs no join
+            pattern_str = patterns[0].to_cypher()
+        else:
+            pattern_str = ", ".join([pattern.to_cypher() for pattern in patterns])
+        return indent + "MATCH " + pattern_str
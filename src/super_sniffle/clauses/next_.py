@@ -5,13 +5,34 @@ from .clause import Clause
 class NextClause(Clause):
     """
     Represents a NEXT clause in Cypher, used for sequential composition of queries.
+    
+    The clause carries no state, so every ``NextClause()`` returns the same
+    shared instance (also available as ``NEXT``).
     """
+    __slots__ = ()
+    
+    _instance: Optional['NextClause'] = None
+    
+    def __new__(cls) -> 'NextClause':
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            super(NextClause, instance).__init__()
+            cls._instance = instance
+        return instance
+    
     def __init__(self):
-        super().__init__()
+        # Initialized once in __new__
+        pass
 
     def to_cypher(self, indent: Optional[str] = None, **kwargs) -> str:
         """
         Convert the NEXT clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        return f"{prefix}NEXT"
+        # Without an indent the rendering is the constant itself
+        if indent:
+            return indent + "NEXT"
+        return "NEXT"
+
+
+NEXT = NextClause()
@@ -1,19 +1,35 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import field
+from typing import Optional, Tuple
 
-from .clause import Clause
+from ..ast.formatting_utils import cached_cypher
+from .clause import KIND_ORDER_BY, Clause
 from ..ast.expressions.order_by_expression import OrderByExpression
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class OrderByClause(Clause):
     """Represents an ORDER BY clause in a Cypher query."""
-    expressions: List[OrderByExpression]
+    _KIND = KIND_ORDER_BY
+    
+    expressions: Tuple[OrderByExpression, ...]
+    _expressions_cypher: str = field(default="", init=False, compare=False, repr=False)
 
+    def __post_init__(self):
+        if type(self.expressions) is not tuple:
+            object.__setattr__(self, "expressions", tuple(self.expressions))
+        # Sort keys are fixed once built, so render them up front; a single
+        # sort key (the common case) needs no join
+        expressions = self.expressions
+        if len(expressions) == 1:
+            rendered = expressions[0].to_cypher()
+        else:
+            rendered = ", ".join([expr.to_cypher() for expr in expressions])
+        object.__setattr__(self, "_expressions_cypher", rendered)
+
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
         Convert the ORDER BY clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        order_str = ", ".join(expr.to_cypher() for expr in self.expressions)
-        return f"{prefix}ORDER BY {order_str}"
+        return indent + "ORDER BY " + self._expressions_cypher
@@ -1,38 +1,68 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Union
+import re
+import sys
+from dataclasses import field
+from typing import Optional, Tuple
 
-from .clause import Clause
+from ..ast.formatting_utils import cached_cypher
+from .clause import KIND_PROJECTION, Clause
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+# Projections worth interning: "*", variables and single property accesses
+# ("n", "n.name"). These recur across queries; free-form expressions are left
+# alone so a long-running process does not grow the intern table with them.
+_INTERNABLE = re.compile(r"\*|[A-Za-z_]\w{0,31}(?:\.[A-Za-z_]\w{0,31})?")
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a short identifier-like string, leaving anything else unchanged."""
+    if type(value) is str and _INTERNABLE.fullmatch(value):
+        return sys.intern(value)
+    return value
+
+
+@fast_frozen_dataclass(slots=True)
 class ReturnClause(Clause):
     """Represents a RETURN clause in a Cypher query."""
-    projections: List[Tuple[str, Optional[str]]] = field(default_factory=list)
+    _KIND = KIND_PROJECTION
+    # Clause keyword indexed by the distinct flag
+    _KEYWORDS = ("RETURN ", "RETURN DISTINCT ")
+    
+    projections: Tuple[Tuple[str, Optional[str]], ...] = ()
     distinct: bool = False
+    _projections_cypher: str = field(default="", init=False, compare=False, repr=False)
 
     def __post_init__(self):
         """Validate the RETURN clause configuration."""
+        # Store projections as a tuple so the clause is hashable and its
+        # cached rendering cannot go stale. The same short names ("*", "n",
+        # "n.name") recur across many clauses, so intern those.
+        object.__setattr__(self, "projections", tuple(
+            [(_intern(expr), _intern(alias)) for expr, alias in self.projections]
+        ))
+        
         if not self.projections:
             raise ValueError("RETURN clause requires at least one projection")
             
-        # Validate projection items
+        # Validate projection items and format them with optional aliases in
+        # one pass; a single projection (e.g. RETURN n) needs no join
+        formatted = []
         for expr, alias in self.projections:
             if not expr:
                 raise ValueError("Projection expression cannot be empty")
+            formatted.append(f"{expr} AS {alias}" if alias else expr)
+        projections_str = formatted[0] if len(formatted) == 1 else ", ".join(formatted)
+        object.__setattr__(self, "_projections_cypher", projections_str)
 
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
         Convert the RETURN clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        distinct_str = " DISTINCT" if self.distinct else ""
-        
-        # Format projections with optional aliases
-        projection_strs = []
-        for expr, alias in self.projections:
-            if alias:
-                projection_strs.append(f"{expr} AS {alias}")
-            else:
-                projection_strs.append(expr)
-                
-        return f"{prefix}RETURN{distinct_str} {', '.join(projection_strs)}"
+        return indent + self._KEYWORDS[self.distinct] + self._projections_cypher
+
+
+# Shared RETURN * clauses, used for return_() without projections and for the
+# implicit RETURN added before pagination
+RETURN_ALL = ReturnClause((("*", None),))
+RETURN_DISTINCT_ALL = ReturnClause((("*", None),), distinct=True)
@@ -1,18 +1,39 @@
-from dataclasses import dataclass
+from dataclasses import field
+from functools import lru_cache
 from typing import Optional, Union
 
 from super_sniffle.ast.expressions.expression import Expression
-from .clause import Clause
+from ..ast.formatting_utils import cached_cypher
+from .clause import KIND_SKIP, Clause
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class SkipClause(Clause):
     """Represents a SKIP clause in a Cypher query."""
+    _KIND = KIND_SKIP
+    
     count: Union[int, Expression]
+    _count_cypher: str = field(default="", init=False, compare=False, repr=False)
 
+    def __post_init__(self):
+        # Render the count once instead of dispatching on its type per call
+        count = self.count
+        rendered = str(count) if isinstance(count, int) else count.to_cypher()
+        object.__setattr__(self, "_count_cypher", rendered)
+
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """Convert the SKIP clause to a Cypher string."""
-        prefix = indent if indent is not None else ""
-        if isinstance(self.count, int):
-            return f"{prefix}SKIP {self.count}"
-        return f"{prefix}SKIP {self.count.to_cypher()}"
+        return indent + "SKIP " + self._count_cypher
+
+
+@lru_cache(maxsize=256)
+def _shared_skip_clause(count: int) -> SkipClause:
+    """
+    Return a shared SKIP clause for an integer count.
+    
+    Integer-count clauses hold no nested patterns, so equal ones can safely be
+    the same instance, along with its cached rendering.
+    """
+    return SkipClause(count)
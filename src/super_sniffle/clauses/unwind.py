@@ -2,24 +2,31 @@
 UNWIND clause implementation for Cypher queries.
 """
 
-from dataclasses import dataclass
-from typing import Union, Optional
+from dataclasses import field
+from typing import Optional
 
+from ..ast.formatting_utils import cached_cypher
 from .clause import Clause
 from ..ast.expressions import Expression
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class UnwindClause(Clause):
     """
     Represents an UNWIND clause in a Cypher query.
     """
     expression: Expression
     variable: str
+    _body: str = field(default="", init=False, compare=False, repr=False)
 
+    def __post_init__(self):
+        # Both parts are fixed once built, so render them up front
+        object.__setattr__(self, "_body", f"UNWIND {self.expression.to_cypher()} AS {self.variable}")
+
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
         Convert the UNWIND clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        return f"{prefix}UNWIND {self.expression.to_cypher()} AS {self.variable}"
+        return indent + self._body
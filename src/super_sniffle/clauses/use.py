@@ -1,11 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import field
 from typing import Union, Optional
 
 from super_sniffle.ast.expressions.expression import Expression
+from super_sniffle.ast.formatting_utils import cached_cypher
 from super_sniffle.clauses.clause import Clause
+from super_sniffle.utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class UseClause(Clause):
     """AST representation of a USE clause for database selection.
     
@@ -14,18 +16,20 @@ class UseClause(Clause):
                   Can be a string, Parameter, FunctionExpression, etc.
     """
     database: Union[str, Expression]
+    _database_cypher: str = field(default="", init=False, compare=False, repr=False)
 
     def __post_init__(self):
         """Validate the database name/expression."""
         if isinstance(self.database, str) and not self.database:
             raise ValueError("Database name cannot be empty")
+        
+        # Render the target once: string names are used as-is, expressions
+        # like parameters and function calls are rendered
+        database = self.database
+        rendered = database if isinstance(database, str) else database.to_cypher()
+        object.__setattr__(self, "_database_cypher", rendered)
 
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """Generates Cypher representation of the USE clause."""
-        prefix = indent if indent is not None else ""
-        if isinstance(self.database, str):
-            # Handle string literals
-            return f"{prefix}USE {self.database}"
-        else:
-            # Handle expressions like parameters and function calls
-            return f"{prefix}USE {self.database.to_cypher()}"
+        return indent + "USE " + self._database_cypher
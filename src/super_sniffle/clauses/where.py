@@ -2,23 +2,24 @@
 WHERE clause implementation for Cypher queries.
 """
 
-from dataclasses import dataclass
 from typing import Optional
 
 from ..ast.expressions import Expression
+from ..ast.formatting_utils import cached_cypher
 from .clause import Clause
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class WhereClause(Clause):
     """
     Represents a WHERE clause in a Cypher query.
     """
     condition: Expression
 
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
         Convert the WHERE clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        return f"{prefix}WHERE {self.condition.to_cypher()}"
+        return indent + "WHERE " + self.condition.to_cypher()
@@ -1,30 +1,45 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import field
+from typing import Optional, Tuple, Union
 
-from .clause import Clause
+from ..ast.formatting_utils import cached_cypher
+from .clause import KIND_PROJECTION, Clause
+from ..utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class WithClause(Clause):
     """Represents a WITH clause in a Cypher query."""
-    projections: List[str]
+    _KIND = KIND_PROJECTION
+    # Clause keyword indexed by the distinct flag
+    _KEYWORDS = ("WITH ", "WITH DISTINCT ")
+    
+    projections: Tuple[Union[str, Tuple[str, str]], ...]
     distinct: bool = False
+    _projections_cypher: str = field(default="", init=False, compare=False, repr=False)
 
+    def __post_init__(self):
+        # Store projections as a tuple so the clause is hashable and its
+        # cached rendering cannot go stale
+        if type(self.projections) is not tuple:
+            object.__setattr__(self, "projections", tuple(self.projections))
+        
+        # Process projections that could be strings or tuples (expression, alias)
+        projections = self.projections
+        if len(projections) == 1:
+            proj = projections[0]
+            projections_str = f"{proj[0]} AS {proj[1]}" if isinstance(proj, tuple) else proj
+        elif all([type(proj) is str for proj in projections]):
+            # Plain names (the common .with_("p", "q")) are joined as-is
+            projections_str = ", ".join(projections)
+        else:
+            projections_str = ", ".join(
+                [f"{proj[0]} AS {proj[1]}" if isinstance(proj, tuple) else proj for proj in projections]
+            )
+        object.__setattr__(self, "_projections_cypher", projections_str)
+
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """
         Convert the WITH clause to a Cypher string.
         """
-        prefix = indent if indent is not None else ""
-        distinct_str = " DISTINCT" if self.distinct else ""
-        
-        # Process projections that could be strings or tuples (expression, alias)
-        processed_projections = []
-        for proj in self.projections:
-            if isinstance(proj, tuple):
-                # Tuple format: (expression, alias)
-                processed_projections.append(f"{proj[0]} AS {proj[1]}")
-            else:
-                processed_projections.append(proj)
-                
-        projections_str = ", ".join(processed_projections)
-        return f"{prefix}WITH{distinct_str} {projections_str}"
+        return indent + self._KEYWORDS[self.distinct] + self._projections_cypher
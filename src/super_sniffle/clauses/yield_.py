@@ -1,10 +1,12 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from dataclasses import field
+from typing import Optional, Tuple
 
+from super_sniffle.ast.formatting_utils import cached_cypher
 from super_sniffle.clauses.clause import Clause
+from super_sniffle.utils.dataclass import fast_frozen_dataclass
 
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class YieldClause(Clause):
     """
     AST representation of a YIELD clause for handling procedure output.
@@ -13,35 +15,33 @@ class YieldClause(Clause):
         columns: List of tuples (column_name, alias) for the YIELD clause
         wildcard: Whether to use YIELD * (returns all columns)
     """
-    columns: List[Tuple[str, Optional[str]]] = field(default_factory=list)
+    columns: Tuple[Tuple[str, Optional[str]], ...] = ()
     wildcard: bool = False
+    _columns_cypher: str = field(default="", init=False, compare=False, repr=False)
 
     def __post_init__(self):
         """Validate the YIELD clause configuration."""
-        if self.wildcard and self.columns:
-            raise ValueError("Cannot specify both wildcard and columns in YIELD clause")
+        if type(self.columns) is not tuple:
+            object.__setattr__(self, "columns", tuple(self.columns))
         
-        if not self.wildcard and not self.columns:
-            raise ValueError("YIELD clause requires either columns or wildcard")
-            
-        # Validate column names
-        for col, alias in self.columns:
-            if not col:
-                raise ValueError("Column name cannot be empty")
+        columns = self.columns
+        if self.wildcard:
+            if columns:
+                raise ValueError("Cannot specify both wildcard and columns in YIELD clause")
+            columns_str = "*"
+        else:
+            if not columns:
+                raise ValueError("YIELD clause requires either columns or wildcard")
+            # Validate column names and format them with optional aliases in one pass
+            formatted = []
+            for col, alias in columns:
+                if not col:
+                    raise ValueError("Column name cannot be empty")
+                formatted.append(f"{col} AS {alias}" if alias else col)
+            columns_str = ", ".join(formatted)
+        object.__setattr__(self, "_columns_cypher", columns_str)
 
+    @cached_cypher
     def to_cypher(self, indent: Optional[str] = None) -> str:
         """Generates Cypher representation of the YIELD clause."""
-        prefix = indent if indent is not None else ""
-        
-        if self.wildcard:
-            return f"{prefix}YIELD *"
-            
-        # Format columns with optional aliases
-        column_strs = []
-        for col, alias in self.columns:
-            if alias:
-                column_strs.append(f"{col} AS {alias}")
-            else:
-                column_strs.append(col)
-                
-        return f"{prefix}YIELD {', '.join(column_strs)}"
+        return indent + "YIELD " + self._columns_cypher
@@ -3,45 +3,59 @@ Compound query for UNION and UNION ALL operations.
 """
 
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
-from dataclasses import dataclass, field
+from itertools import islice
+from typing import List, Tuple, Union, TYPE_CHECKING
+
+from .utils.dataclass import fast_frozen_dataclass
 
 if TYPE_CHECKING:
     from .api import QueryBuilder
 
+# Union keywords, shared by every compound query instead of repeating literals
+UNION = "UNION"
+UNION_ALL = "UNION ALL"
+
 
-@dataclass(frozen=True)
+@fast_frozen_dataclass(slots=True)
 class CompoundQuery:
     """
     Represents a compound query using UNION or UNION ALL.
     """
-    queries: List[QueryBuilder] = field(default_factory=list)
-    union_operators: List[str] = field(default_factory=list)
+    queries: Union[Tuple[QueryBuilder, ...], List[QueryBuilder]] = ()
+    union_operators: Union[Tuple[str, ...], List[str]] = ()
+
+    def __post_init__(self):
+        # Store both sequences as immutable tuples; lists are accepted for convenience
+        if type(self.queries) is not tuple:
+            object.__setattr__(self, "queries", tuple(self.queries))
+        if type(self.union_operators) is not tuple:
+            object.__setattr__(self, "union_operators", tuple(self.union_operators))
 
     def union(self, other: QueryBuilder) -> "CompoundQuery":
         """
         Adds a query to be combined with UNION.
         """
-        return CompoundQuery(
-            queries=self.queries + [other],
-            union_operators=self.union_operators + ["UNION"]
-        )
+        return self._extend(UNION, other)
 
     def union_all(self, other: QueryBuilder) -> "CompoundQuery":
         """
         Adds a query to be combined with UNION ALL.
         """
-        return CompoundQuery(
-            queries=self.queries + [other],
-            union_operators=self.union_operators + ["UNION ALL"]
-        )
+        return self._extend(UNION_ALL, other)
+
+    def _extend(self, operator: str, other: QueryBuilder) -> "CompoundQuery":
+        """Return a new compound query with ``other`` appended after ``operator``."""
+        # Positional construction skips the keyword-argument handling
+        return CompoundQuery(self.queries + (other,), self.union_operators + (operator,))
 
     def to_cypher(self) -> str:
         """
         Converts the compound query to a Cypher string.
         """
-        result = [self.queries[0].to_cypher()]
-        for i, query in enumerate(self.queries[1:]):
-            result.append(self.union_operators[i])
+        queries = self.queries
+        result = [queries[0].to_cypher()]
+        # Pair each operator with the query after it, without slicing a copy
+        for operator, query in zip(self.union_operators, islice(queries, 1, None)):
+            result.append(operator)
             result.append(query.to_cypher())
         return "\n".join(result)
@@ -0,0 +1,89 @@
+"""
+Dataclass helpers shared by the pattern and clause classes.
+"""
+
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Dict, Optional
+
+
+def fast_frozen_dataclass(cls: Optional[type] = None, *, slots: bool = False, **kwargs: Any) -> Any:
+    """
+    Create a frozen dataclass whose hash is computed once per instance.
+
+    Behaves like ``@dataclass(frozen=True)``. The generated field-wise
+    ``__hash__`` is wrapped so the result is stored on first use, since
+    instances never change afterwards.
+
+    Args:
+        cls: The class to decorate (when used without arguments)
+        slots: Whether to store fields in ``__slots__`` instead of a
+               per-instance ``__dict__``
+        **kwargs: Extra arguments passed through to ``dataclass``
+
+    Returns:
+        The decorated class, or a decorator when called with arguments only
+
+    Example:
+        >>> @fast_frozen_dataclass(slots=True)
+        ... class Point:
+        ...     x: int
+        ...     y: int
+    """
+    def wrap(cls: type) -> type:
+        # Declare the cache as an excluded field so it also works with __slots__
+        annotations = cls.__dict__.get("__annotations__", {})
+        annotations["_hash_cache"] = "Optional[int]"
+        cls.__annotations__ = annotations
+        setattr(cls, "_hash_cache", field(default=None, init=False, compare=False, repr=False))
+
+        cls = dataclass(frozen=True, slots=slots, **kwargs)(cls)
+        # The state handlers generated for frozen slotted classes read every
+        # field and keep the caches; use the ones that skip both
+        cls.__getstate__ = _slots_getstate  # type: ignore[attr-defined]
+        cls.__setstate__ = _slots_setstate  # type: ignore[attr-defined]
+
+        field_hash = cls.__hash__
+        if field_hash is not None:
+            def __hash__(self: Any) -> int:
+                # Subclasses declared without slots may not have set the cache
+                cached = getattr(self, "_hash_cache", None)
+                if cached is None:
+                    cached = field_hash(self)
+                    object.__setattr__(self, "_hash_cache", cached)
+                return cached
+
+            cls.__hash__ = __hash__  # type: ignore[assignment]
+        return cls
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+# Caches left out of pickled and copied state: str hashes depend on
+# PYTHONHASHSEED, so a stored hash is only valid in the process that computed
+# it, and rendered Cypher is cheap to rebuild on first use
+_TRANSIENT_FIELDS = frozenset({"_hash_cache", "_cypher_cache"})
+
+
+def _slots_getstate(self: Any) -> Dict[str, Any]:
+    # Slots left unset (e.g. an init=False field on an instance built without
+    # __init__) are skipped; one getattr with a sentinel replaces a
+    # hasattr/getattr pair
+    state = {}
+    for f in fields(self):
+        if f.name in _TRANSIENT_FIELDS:
+            continue
+        value = getattr(self, f.name, MISSING)
+        if value is not MISSING:
+            state[f.name] = value
+    return state
+
+
+def _slots_setstate(self: Any, state: Dict[str, Any]) -> None:
+    # Caches start empty and are recomputed in the receiving process
+    for f in fields(self):
+        if f.name in _TRANSIENT_FIELDS:
+            object.__setattr__(self, f.name, None)
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
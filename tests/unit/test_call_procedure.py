@@ -30,3 +30,11 @@ def test_optional_call_procedure_in_query_builder():
     query = QueryBuilder().optional_call_procedure("apoc.neighbors.tohop", var("n"), "KNOWS>", literal(1))
     cypher = query.to_cypher()
     assert cypher == "OPTIONAL CALL apoc.neighbors.tohop(n, 'KNOWS>', 1)"
+
+def test_call_procedure_arguments_stored_as_tuple():
+    from super_sniffle.clauses import CallProcedureClause
+    
+    assert CallProcedureClause("db.labels").arguments == ()
+    clause = CallProcedureClause("db.labels", ["a", var("n")])
+    assert isinstance(clause.arguments, tuple)
+    assert clause.to_cypher() == "CALL db.labels('a', n)"
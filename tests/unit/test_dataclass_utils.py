@@ -0,0 +1,134 @@
+"""
+Unit tests for the dataclass helpers.
+"""
+
+import copy
+import dataclasses
+import os
+import subprocess
+import sys
+
+import pytest
+from super_sniffle.utils.dataclass import fast_frozen_dataclass
+from super_sniffle.api import relationship, prop, var
+from super_sniffle.clauses import (
+    LimitClause, WhereClause, ReturnClause, WithClause, SkipClause,
+    UnwindClause, UseClause, YieldClause, NextClause, GroupByClause,
+    CallSubqueryClause,
+)
+
+
+@fast_frozen_dataclass
+class Point:
+    x: int
+    y: int = 0
+
+
+def test_fast_frozen_dataclass_is_frozen():
+    """Test that instances cannot be modified."""
+    p = Point(1, 2)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        p.x = 3
+
+
+def test_fast_frozen_dataclass_hash_cached():
+    """Test that the hash matches field-wise equality and is stored."""
+    p = Point(1, 2)
+    assert p == Point(1, 2)
+    assert hash(p) == hash(Point(1, 2))
+    assert p._hash_cache == hash(p)
+    assert "_hash_cache" not in repr(p)
+    assert [f.name for f in dataclasses.fields(p) if f.init] == ["x", "y"]
+
+
+def test_relationship_pattern_hash():
+    """Test that relationship patterns hash by value."""
+    r1 = relationship("KNOWS", direction=">", variable="r", since=2020)
+    r2 = relationship("KNOWS", direction=">", variable="r", since=2020)
+    assert r1 == r2
+    assert len({r1, r2}) == 1
+
+
+def test_slots_remove_instance_dict():
+    """Test that slotted pattern and clause classes have no __dict__."""
+    r = relationship("KNOWS", direction=">", variable="r")
+    assert not hasattr(r, "__dict__")
+    assert r.to_cypher() == "-[r:KNOWS]->"
+    
+    limit = LimitClause(10)
+    assert not hasattr(limit, "__dict__")
+    assert copy.copy(limit) == limit
+    assert copy.copy(limit).to_cypher() == "LIMIT 10"
+
+
+@pytest.mark.parametrize("clause", [
+    WhereClause(prop("p", "age") > 30),
+    ReturnClause([("p", None)]),
+    WithClause(["p"]),
+    SkipClause(5),
+    UnwindClause(var("xs"), "x"),
+    UseClause("movies"),
+    YieldClause(wildcard=True),
+    NextClause(),
+])
+def test_all_clauses_slotted(clause):
+    """Test that every clause type stores its fields in slots."""
+    assert not hasattr(clause, "__dict__")
+    assert clause.to_cypher()
+
+
+@pytest.mark.parametrize("make_clause", [
+    lambda: ReturnClause([("p", None)]),
+    lambda: WithClause(["p", ("p.age", "age")]),
+    lambda: YieldClause([("label", None)]),
+    lambda: GroupByClause(["p.city"]),
+    lambda: CallSubqueryClause(None, ["a", "b"]),
+])
+def test_list_fields_stored_as_tuples(make_clause):
+    """Test that clauses built from lists are hashable and compare equal."""
+    assert hash(make_clause()) == hash(make_clause())
+    assert make_clause() == make_clause()
+
+
+def test_slots_state_skips_unset_fields():
+    """Test that copy and pickle tolerate slots never assigned by __init__."""
+    @fast_frozen_dataclass(slots=True)
+    class Cached:
+        name: str
+        _cache: str = dataclasses.field(default=None, init=False, compare=False)
+    
+    c = Cached.__new__(Cached)
+    object.__setattr__(c, "name", "a")
+    clone = copy.copy(c)
+    assert clone.name == "a"
+    assert not hasattr(clone, "_cache")
+    assert copy.deepcopy(c).name == "a"
+
+
+def test_pickle_drops_hash_from_another_process():
+    """Test that a pickle made under another hash seed hashes like a fresh object."""
+    make = (
+        "from super_sniffle.api import relationship\n"
+        "r = relationship('KNOWS', direction='>', variable='r')\n"
+    )
+    dump = make + (
+        "hash(r); r.to_cypher()\n"
+        "import pickle, sys; sys.stdout.write(pickle.dumps(r).hex())\n"
+    )
+    load = make + (
+        "import pickle, sys\n"
+        "r2 = pickle.loads(bytes.fromhex(sys.stdin.read()))\n"
+        "assert r2._hash_cache is None and r2._cypher_cache is None\n"
+        "assert r == r2 and hash(r) == hash(r2)\n"
+        "assert r2 in {r} and len({r, r2}) == 1 and {r: 1}[r2] == 1\n"
+        "print(r2.to_cypher())\n"
+    )
+    
+    def run(code, seed, stdin=None):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        return subprocess.run(
+            [sys.executable, "-c", code], input=stdin, env=env,
+            capture_output=True, text=True, check=True,
+        ).stdout
+    
+    assert run(load, "2", stdin=run(dump, "1")).strip() == "-[r:KNOWS]->"
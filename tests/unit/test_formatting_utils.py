@@ -0,0 +1,102 @@
+"""
+Unit tests for value formatting helpers.
+
+Tests that format_value renders Cypher literals correctly, including the
+memoized fast path for scalar values.
+"""
+
+from super_sniffle.ast.formatting_utils import format_value, _format_scalar
+from super_sniffle.api import node, match, prop
+
+
+def test_format_scalars():
+    """Test formatting of scalar values."""
+    assert format_value(42) == "42"
+    assert format_value(1.5) == "1.5"
+    assert format_value("text") == '"text"'
+    assert format_value('say "hi"') == '"say \\"hi\\""'
+    assert format_value(None) == "null"
+
+
+def test_format_bool_not_confused_with_int():
+    """Test that cached values of equal hash do not collide across types."""
+    assert format_value(1) == "1"
+    assert format_value(True) == "true"
+    assert format_value(0) == "0"
+    assert format_value(False) == "false"
+    assert format_value(1.0) == "1.0"
+
+
+def test_format_collections():
+    """Test formatting of unhashable and nested values."""
+    assert format_value([1, "a", True]) == '[1, "a", true]'
+    assert format_value((1, 2)) == "[1, 2]"
+    assert format_value({"k": [1, None]}) == "{k: [1, null]}"
+
+
+def test_format_str_subclass():
+    """Test that string subclasses take the general path and are still escaped."""
+    class Name(str):
+        pass
+    
+    assert format_value(Name("plain")) == '"plain"'
+    assert format_value(Name('a"b')) == '"a\\"b"'
+
+
+def test_repeated_scalars_hit_cache():
+    """Test that repeated scalar values are served from the cache."""
+    format_value("cached-literal")
+    hits = _format_scalar.cache_info().hits
+    assert format_value("cached-literal") == '"cached-literal"'
+    assert _format_scalar.cache_info().hits == hits + 1
+
+
+def test_unhashable_values_bypass_cache():
+    """Test that lists and dicts are formatted without a TypeError from the cache."""
+    misses = _format_scalar.cache_info().misses
+    assert format_value([[1], {"a": []}]) == "[[1], {a: []}]"
+    # Only the nested scalar 1 can be looked up in the cache
+    assert _format_scalar.cache_info().misses - misses <= 1
+
+
+def test_signed_zero_and_nan_not_shared():
+    """Test that floats equal by value but printed differently stay distinct."""
+    assert format_value(-0.0) == "-0.0"
+    assert format_value(0.0) == "0.0"
+    assert format_value(float("nan")) == "nan"
+    pattern = node("P", variable="p", a=-0.0, b=0.0)
+    assert pattern.to_cypher() == "(p:P {a: -0.0, b: 0.0})"
+
+
+def test_patterns_and_clauses_share_cache_shape():
+    """Test that one decorator caches patterns and clauses under the same key."""
+    pattern = node("P", variable="p")
+    clause = match(pattern).clauses[0]
+    assert pattern.to_cypher() == "(p:P)"
+    assert clause.to_cypher(indent="  ") == "  MATCH (p:P)"
+    assert pattern._cypher_cache == ("", "(p:P)")
+    assert clause._cypher_cache == ("  ", "  MATCH (p:P)")
+
+
+def test_unnamed_nodes_not_cached_until_named():
+    """Test that renderings of a node awaiting a lazy variable are not stored."""
+    person = node("Person")
+    query = match(person).return_("1")
+    assert query.to_cypher() == "MATCH (:Person)\nRETURN 1"
+    assert person._cypher_cache is None
+    assert query._cypher_cache is None
+    
+    name = person.prop("age").to_cypher().split(".")[0]
+    assert query.to_cypher() == f"MATCH ({name}:Person)\nRETURN 1"
+    assert query._cypher_cache is not None
+
+
+def test_cache_hits_survive_unrelated_lazy_naming():
+    """Test that naming nodes in other queries leaves cached renderings in place."""
+    query = match(node("Person", variable="p")).where(prop("p", "age") > 1).return_("p")
+    cached = query.to_cypher()
+    for _ in range(200):
+        other = node("Person")
+        match(other).where(other.prop("age") > 1).return_(other).to_cypher()
+        # The same string object means the cache answered, not a re-render
+        assert query.to_cypher() is cached
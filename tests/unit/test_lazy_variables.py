@@ -6,7 +6,7 @@ and get automatically generated variables only when referenced in queries.
 """
 
 import pytest
-from super_sniffle.api import node, match, literal
+from super_sniffle.api import node, match, literal, call_subquery
 from super_sniffle.ast.patterns.node_pattern import (
     NodePattern, 
     _get_next_variable_name, 
@@ -304,4 +304,39 @@ class TestBackwardCompatibility:
             "WHERE p.age > 25", 
             "RETURN p, person.name AS name"
         ]
-        assert cypher == "\n".join(expected_lines)
\ No newline at end of file
+        assert cypher == "\n".join(expected_lines)
+    
+    def test_cached_rendering_refreshed_after_variable_assigned(self):
+        """Test that cached Cypher picks up a variable generated later."""
+        person = node("Person")
+        query = call_subquery(match(person).return_("1"))
+        assert query.to_cypher() == "CALL() {\n  MATCH (:Person)\n  RETURN 1\n}"
+        
+        # Referencing the node assigns a variable; the clause must re-render
+        person.prop("age")
+        assert query.to_cypher() == "CALL() {\n  MATCH (_node_bolden:Person)\n  RETURN 1\n}"
+
+    def test_cached_match_refreshed_after_variable_assigned(self):
+        """Test that a rendered MATCH clause picks up a variable generated later."""
+        person = node("Person")
+        clause = match(person).clauses[0]
+        assert clause.to_cypher() == "MATCH (:Person)"
+        assert clause.to_cypher() == "MATCH (:Person)"
+        
+        person.prop("age")
+        assert clause.to_cypher() == "MATCH (_node_bolden:Person)"
+
+    def test_cached_path_refreshed_after_anonymous_node_named(self):
+        """Test that a fully anonymous node in a path renders its generated variable."""
+        from super_sniffle.api import path, relationship
+        
+        friend = node()
+        knows = path(node("Person", variable="p"), relationship("KNOWS", direction=">"), friend)
+        assert knows.to_cypher() == "(p:Person)-[:KNOWS]->()"
+        # The unnamed node may still get a variable, so nothing is cached yet
+        assert knows._cypher_cache is None
+        
+        str(friend)
+        assert friend.to_cypher() == "(_node_bolden)"
+        assert knows.to_cypher() == "(p:Person)-[:KNOWS]->(_node_bolden)"
+        assert knows.to_cypher() is knows.to_cypher()
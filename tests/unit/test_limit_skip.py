@@ -6,7 +6,7 @@ pagination patterns, and integration with other query clauses.
 """
 
 import pytest
-from super_sniffle import match, node, prop, var, literal, asc, desc
+from super_sniffle import match, node, prop, var, literal, param, asc, desc
 
 
 class TestBasicLimit:
@@ -21,3 +21,62 @@ class TestBasicLimit:
         )
         result = query.to_cypher()
         expected = "MATCH (p:Person)\nRETURN p.name, p.age\nLIMIT 5"
+        assert result == expected
+
+
+class TestPaginationOrdering:
+    """Test that pagination clauses are moved to the end of the query."""
+    
+    def test_pagination_rendered_after_projection(self):
+        """Test ORDER BY, SKIP and LIMIT follow RETURN regardless of call order."""
+        query = (
+            match(node("Person", variable="p"))
+            .limit(5)
+            .skip(10)
+            .order_by(desc("p.age"))
+            .return_("p.name")
+        )
+        expected = "MATCH (p:Person)\nRETURN p.name\nORDER BY p.age DESC\nSKIP 10\nLIMIT 5"
+        assert query.to_cypher() == expected
+    
+    def test_custom_clause_kept_in_place(self):
+        """Test that clause subclasses without a kind render in call order."""
+        from super_sniffle.api import QueryBuilder
+        from super_sniffle.clauses import Clause, MatchClause
+        
+        class CommentClause(Clause):
+            def to_cypher(self, indent=None):
+                return (indent or "") + "// comment"
+        
+        query = QueryBuilder([MatchClause([node(variable="n")]), CommentClause()]).limit(1)
+        assert query.to_cypher() == "MATCH (n)\n// comment\nRETURN *\nLIMIT 1"
+    
+    def test_non_clause_object_kept_in_place(self):
+        """Test that objects outside the Clause hierarchy render in call order."""
+        from super_sniffle.api import QueryBuilder
+        from super_sniffle.clauses import MatchClause
+        
+        class RawCypher:
+            def to_cypher(self, indent=None):
+                return (indent or "") + "// raw"
+        
+        query = QueryBuilder([MatchClause([node(variable="n")]), RawCypher()]).limit(1)
+        assert query.to_cypher() == "MATCH (n)\n// raw\nRETURN *\nLIMIT 1"
+
+
+class TestSharedPaginationClauses:
+    """Test that integer SKIP and LIMIT clauses are shared between queries."""
+    
+    def test_integer_counts_share_clause(self):
+        """Test that equal integer counts reuse one clause instance."""
+        first = match(node("Person", variable="p")).return_("p").skip(10).limit(5)
+        second = match(node("Movie", variable="m")).return_("m").skip(10).limit(5)
+        assert first.clauses[-2] is second.clauses[-2]
+        assert first.clauses[-1] is second.clauses[-1]
+        assert second.to_cypher() == "MATCH (m:Movie)\nRETURN m\nSKIP 10\nLIMIT 5"
+    
+    def test_expression_counts_not_shared(self):
+        """Test that expression counts still build their own clause."""
+        query = match(node("Person", variable="p")).return_("p").limit(param("n"))
+        other = match(node("Person", variable="p")).return_("p").limit(param("n"))
+        assert query.clauses[-1] is not other.clauses[-1]
@@ -5,6 +5,10 @@ Tests the working MATCH clause functionality including basic patterns,
 relationships, inline conditions, and complex path construction.
 """
 
+import copy
+import dataclasses
+import pickle
+
 import pytest
 from super_sniffle import match, node, relationship, path, prop, param, literal
 import logging
@@ -279,3 +283,49 @@ class TestEdgeCases:
         result = query.to_cypher()
         expected = "MATCH (p:Person)-[:KNOWS]->(f:Person)"
         assert result == expected
+
+
+class TestMatchClauseStorage:
+    """Test how MatchClause stores its patterns."""
+    
+    def test_patterns_stored_as_tuple(self):
+        """Test that patterns are kept as a hashable tuple."""
+        from super_sniffle.clauses import MatchClause
+        
+        p = node("Person", variable="p")
+        clause = match(p).clauses[0]
+        assert clause.patterns == (p,)
+        assert MatchClause([p]) == clause
+        assert hash(MatchClause([p])) == hash(clause)
+    
+    def test_builder_clauses_stored_as_tuple(self):
+        """Test that chaining extends a new clause tuple and leaves the original intact."""
+        from super_sniffle.api import QueryBuilder
+        
+        base = match(node("Person", variable="p"))
+        extended = base.return_("p")
+        assert isinstance(extended.clauses, tuple)
+        assert extended.clauses[0] is base.clauses[0]
+        assert len(base.clauses) == 1
+        assert QueryBuilder(list(extended.clauses)) == extended
+    
+    def test_builder_rendering_cached(self):
+        """Test that a builder caches its query per indent and epoch."""
+        query = match(node("Person", variable="p")).return_("p")
+        assert query.to_cypher() is query.to_cypher()
+        assert query.to_cypher(indent="  ") == "  MATCH (p:Person)\n  RETURN p"
+        assert query.to_cypher() == "MATCH (p:Person)\nRETURN p"
+        assert query.limit(1).to_cypher() == "MATCH (p:Person)\nRETURN p\nLIMIT 1"
+    
+    def test_chained_builder_copy_and_pickle(self):
+        """Test that builders made by chaining survive copy, pickle and asdict."""
+        query = match(node("Person", variable="p")).return_("p")
+        query.to_cypher()
+        assert copy.copy(query) == query
+        for clone in (
+            copy.copy(query),
+            copy.deepcopy(query),
+            pickle.loads(pickle.dumps(query)),
+        ):
+            assert clone.to_cypher() == "MATCH (p:Person)\nRETURN p"
+        assert dataclasses.asdict(query)["clauses"]
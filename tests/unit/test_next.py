@@ -56,3 +56,28 @@ def test_next_clause_with_multiple_segments():
         "RETURN c"
     )
     assert cypher == expected
+
+def test_sequence_joins_queries_with_next():
+    from super_sniffle.api import sequence
+    
+    q1 = match(node(variable="a")).return_("a")
+    q2 = match(node(variable="b")).return_("b")
+    q3 = match(node(variable="c")).return_("c")
+    
+    assert sequence(q1, q2, q3).to_cypher() == (
+        "MATCH (a)\nRETURN a\nNEXT\n"
+        "MATCH (b)\nRETURN b\nNEXT\n"
+        "MATCH (c)\nRETURN c"
+    )
+    assert sequence(q1).to_cypher() == q1.to_cypher()
+    assert sequence().clauses == ()
+
+
+def test_next_clause_is_shared():
+    import copy
+    import pickle
+    from super_sniffle.clauses.next_ import NEXT
+    
+    assert NextClause() is NEXT
+    assert copy.deepcopy(NEXT) is NEXT
+    assert pickle.loads(pickle.dumps(NEXT)) is NEXT
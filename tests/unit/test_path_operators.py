@@ -100,3 +100,53 @@ class TestPathOperators:
         # With automatic implicit relationship
         path4 = path(n1, existing_path)
         assert path4.to_cypher() == "(n1:Person)--(c:Company)-[w:WORKS_AT]->"
+
+    def test_path_elements_stored_as_tuple(self):
+        """Test that path elements are normalised to a tuple."""
+        n1 = node("Person", variable="n1")
+        r = relationship("KNOWS", direction=">", variable="r")
+        n2 = node("Person", variable="n2")
+        
+        # Already well-formed: elements are kept as-is
+        simple = PathPattern([n1, r, n2])
+        assert simple.elements == (n1, r, n2)
+        
+        # Needs an implicit relationship inserted
+        implicit = PathPattern([n1, n2])
+        assert isinstance(implicit.elements, tuple)
+        assert len(implicit.elements) == 3
+
+    def test_concat_matches_direct_construction(self):
+        """Test that concat produces the same elements as building the path directly."""
+        a = node("Person", variable="a")
+        b = node("Person", variable="b")
+        r = relationship("KNOWS", direction=">", variable="r")
+        
+        joined = PathPattern([a, r]).concat(PathPattern([b]))
+        assert joined.elements == PathPattern([a, r, b]).elements
+        
+        # Implicit relationship at the junction of two distinct nodes
+        joined = PathPattern([a]).concat(PathPattern([b, r]))
+        assert joined.elements == PathPattern([a, b, r]).elements
+        assert joined.to_cypher() == "(a:Person)--(b:Person)-[r:KNOWS]->"
+        
+        # Continuing from the same node instance does not repeat it
+        joined = PathPattern([a, r, b]).concat(PathPattern([b, r, a]))
+        assert joined.to_cypher() == "(a:Person)-[r:KNOWS]->(b:Person)-[r:KNOWS]->(a:Person)"
+
+    def test_add_accepts_pattern_subclasses(self):
+        """Test that + dispatches on subclasses of the pattern types."""
+        from super_sniffle.ast import NodePattern
+        
+        class PersonNode(NodePattern):
+            pass
+        
+        a = node("Person", variable="a")
+        b = PersonNode(variable="b", labels="Person")
+        r = relationship("KNOWS", direction=">", variable="r")
+        
+        assert (a + r + b).to_cypher() == "(a:Person)-[r:KNOWS]->(b:Person)"
+        assert (r + b).to_cypher() == "-[r:KNOWS]->(b:Person)"
+        
+        with pytest.raises(TypeError):
+            a + "not a pattern"
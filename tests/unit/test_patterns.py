@@ -5,6 +5,9 @@ Tests the node, relationship, and path pattern classes with inline WHERE
 conditions, ensuring proper Cypher generation and method chaining.
 """
 
+import subprocess
+import sys
+
 import pytest
 from super_sniffle.ast import NodePattern, RelationshipPattern, PathPattern, QuantifiedPathPattern
 from super_sniffle.api import node, relationship, path, prop, param, literal, L
@@ -142,6 +145,17 @@ class TestQuantifiedPatterns:
         rel2 = path.zero_or_more()
         assert rel2.to_cypher() == "(()--())*"
 
+    def test_quantify_open_bounds(self):
+        """Test relationship quantifiers with one open bound."""
+        rel = relationship("LINK", direction=">")
+        assert rel.quantify(min_hops=2).to_cypher() == "-[:LINK]->{2,}"
+        assert rel.quantify(max_hops=3).to_cypher() == "-[:LINK]->{,3}"
+        # Repeated bounds give the same result
+        assert rel.quantify(min_hops=2).to_cypher() == "-[:LINK]->{2,}"
+        
+        with pytest.raises(ValueError):
+            rel.quantify()
+
 # New tests for relationship pattern with start node
 def test_relationship_with_start_node():
     """Test relationship created from node includes node pattern"""
@@ -154,17 +168,26 @@ def test_standalone_relationship():
     rel = relationship("KNOWS", variable="r", direction=">")
     assert rel.to_cypher() == '-[r:KNOWS]->'
 
-    def test_node_with_properties():
-        """Test node with properties in relationship pattern"""
-        n = node("Person", variable="n", name="Alice", age=30)
-        rel = n.relationship("KNOWS", variable="r", direction=">")
-        # Property order may vary
-        cypher = rel.to_cypher()
-        assert '(n:Person' in cypher
-        # Accept both single and double quotes
-        assert ("name: 'Alice'" in cypher) or ('name: "Alice"' in cypher)
-        assert 'age: 30' in cypher
-        assert '-[r:KNOWS]->' in cypher
+def test_node_with_properties():
+    """Test node with properties in relationship pattern"""
+    n = node("Person", variable="n", name="Alice", age=30)
+    rel = n.relationship("KNOWS", variable="r", direction=">")
+    # Property order may vary
+    cypher = rel.to_cypher()
+    assert '(n:Person' in cypher
+    # Accept both single and double quotes
+    assert ("name: 'Alice'" in cypher) or ('name: "Alice"' in cypher)
+    assert 'age: 30' in cypher
+    assert '-[r:KNOWS]->' in cypher
+
+def test_relationship_where_keeps_fields():
+    """Test that where() copies every other field of the relationship"""
+    n = node("Person", variable="n")
+    rel = RelationshipPattern(">", "r", "KNOWS", {"since": 2020}, start_node=n)
+    filtered = rel.where(prop("r", "weight") > 1)
+    assert filtered.start_node is n
+    assert filtered.properties == rel.properties
+    assert filtered.to_cypher() == '-[r:KNOWS {since: 2020} WHERE r.weight > 1]->'
 
 def test_node_with_label_expression():
     """Test node with label expression in relationship"""
@@ -187,3 +210,62 @@ def test_complex_path_construction():
     assert cypher.startswith('(n:Person)')
     assert '-[r:KNOWS]->' in cypher
     assert '(m:Person)' in cypher
+
+def test_anonymous_relationship_is_shared():
+    """Test that anonymous relationships reuse one instance per direction"""
+    assert RelationshipPattern.anonymous(">") is RelationshipPattern.anonymous(">")
+    assert RelationshipPattern.anonymous("<").to_cypher() == '<--'
+    assert RelationshipPattern.anonymous(">").to_cypher() == '-->'
+    assert RelationshipPattern.anonymous().to_cypher() == '--'
+    
+    # Implicit relationships between consecutive nodes use the shared instance
+    p = node("Person", variable="a") + node("Person", variable="b")
+    assert p.elements[1] is RelationshipPattern.anonymous("-")
+
+def test_anonymous_relationship_skips_render_cache():
+    """Test that anonymous relationships render without touching the cache"""
+    rel = RelationshipPattern(direction="->")
+    assert rel.to_cypher() == '-->'
+    assert rel._cypher_cache is None
+    
+    typed = RelationshipPattern(direction="->", type="KNOWS")
+    assert typed.to_cypher() == '-[:KNOWS]->'
+    assert typed._cypher_cache is not None
+
+def test_properties_stored_as_tuple():
+    """Test that property dicts are converted to (key, value) pairs"""
+    n = NodePattern("n", ("Person",), {"name": "Alice", "age": 30})
+    assert n.properties == (("name", "Alice"), ("age", 30))
+    assert n.to_cypher() == '(n:Person {name: "Alice", age: 30})'
+    assert hash(n) == hash(NodePattern("n", ("Person",), {"name": "Alice", "age": 30}))
+    
+    r = relationship("KNOWS", direction=">", since=2020)
+    assert r.properties == (("since", 2020),)
+    assert r.to_cypher() == '-[:KNOWS {since: 2020}]->'
+
+
+@pytest.mark.parametrize("module", [
+    "node_pattern", "relationship_pattern", "path_pattern", "quantified_path_pattern",
+])
+def test_pattern_module_imported_first(module):
+    """Test that each pattern module works when imported first in a fresh interpreter"""
+    code = (
+        f"import super_sniffle.ast.patterns.{module}\n"
+        "from super_sniffle.ast.patterns.path_pattern import PathPattern\n"
+        "from super_sniffle.ast.patterns.node_pattern import NodePattern\n"
+        "from super_sniffle.ast.patterns.relationship_pattern import RelationshipPattern\n"
+        "a, b = NodePattern('a'), NodePattern('b')\n"
+        "p = PathPattern([a, b]).one_or_more()\n"
+        "print((RelationshipPattern('>') + b).to_cypher(), p.to_cypher())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "-->(b) ((a)--(b))+"
+
+
+def test_relationship_add_dispatch_filled_at_import():
+    """Test that RelationshipPattern.__add__ needs no setup on first use"""
+    from super_sniffle.ast.patterns import relationship_pattern
+    assert NodePattern in relationship_pattern._ADD_DISPATCH
+    assert PathPattern in relationship_pattern._ADD_DISPATCH
@@ -5,6 +5,8 @@ Tests the working RETURN clause functionality including basic projections,
 DISTINCT clause, and integration with other query clauses.
 """
 
+import sys
+
 import pytest
 from super_sniffle import match, node, prop, param, literal
 
@@ -325,3 +327,55 @@ class TestReturnEdgeCases:
         result = query.to_cypher()
         expected = "MATCH (p:Person)\nRETURN count(p), avg(p.age), max(p.salary)"
         assert result == expected
+
+
+class TestReturnClauseStorage:
+    """Test how RETURN clauses store projections and cache their rendering."""
+    
+    def test_projections_stored_as_tuple(self):
+        """Test that list projections are converted so the clause is hashable."""
+        from super_sniffle.clauses import ReturnClause
+        
+        clause = ReturnClause([("n", None), ("m.name", "name")])
+        assert clause.projections == (("n", None), ("m.name", "name"))
+        assert hash(clause) == hash(ReturnClause((("n", None), ("m.name", "name"))))
+    
+    def test_rendering_cached_per_indent(self):
+        """Test that a cached rendering is not reused for a different indent."""
+        from super_sniffle.clauses import ReturnClause
+        
+        clause = ReturnClause([("n", None)], distinct=True)
+        assert clause.to_cypher() == "RETURN DISTINCT n"
+        assert clause.to_cypher() is clause.to_cypher()
+        assert clause.to_cypher(indent="  ") == "  RETURN DISTINCT n"
+        assert clause.to_cypher() == "RETURN DISTINCT n"
+    
+    def test_projection_strings_interned(self):
+        """Test that equal identifier-like projections are shared between clauses."""
+        from super_sniffle.clauses import ReturnClause
+        
+        expr = "".join(["n", ".name"])
+        first = ReturnClause([(expr, None)])
+        second = ReturnClause([("n.name", "total")])
+        assert first.projections[0][0] is second.projections[0][0]
+        assert second.projections[0][1] is sys.intern("total")
+    
+    def test_free_form_projections_not_interned(self):
+        """Test that arbitrary expressions are stored as given, not interned."""
+        from super_sniffle.clauses import ReturnClause
+        
+        expr = "".join(["count", "(n.name)"])
+        clause = ReturnClause([(expr, None)])
+        assert clause.projections[0][0] is expr
+        assert clause.to_cypher() == "RETURN count(n.name)"
+    
+    def test_return_star_shared(self):
+        """Test that RETURN * clauses reuse a shared instance."""
+        from super_sniffle.clauses.return_ import RETURN_ALL, RETURN_DISTINCT_ALL
+        
+        query = match(node("Person", variable="p")).return_()
+        assert query.clauses[-1] is RETURN_ALL
+        assert query.to_cypher() == "MATCH (p:Person)\nRETURN *"
+        distinct = match(node("Person", variable="p")).return_(distinct=True)
+        assert distinct.clauses[-1] is RETURN_DISTINCT_ALL
+        assert distinct.to_cypher() == "MATCH (p:Person)\nRETURN DISTINCT *"
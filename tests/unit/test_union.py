@@ -70,3 +70,21 @@ class TestUnion:
             "MATCH (p:Person)\nWHERE p.age < 20\nRETURN p.name"
         )
         assert result == expected
+
+
+class TestCompoundQueryStorage:
+    """Test how compound queries store their parts."""
+
+    def test_parts_stored_as_tuples(self):
+        """Test that chained unions keep hashable tuples and share the operands."""
+        from super_sniffle.compound_query import CompoundQuery
+
+        query1 = match(node("Person", variable="p")).return_("p.name AS name")
+        query2 = match(node("Movie", variable="m")).return_("m.title AS name")
+        union_query = query1.union(query2).union_all(query1)
+
+        assert union_query.queries == (query1, query2, query1)
+        assert union_query.union_operators == ("UNION", "UNION ALL")
+        assert CompoundQuery([query1, query2], ["UNION"]) == query1.union(query2)
+        assert hash(union_query) == hash(query1.union(query2).union_all(query1))
+        assert not hasattr(union_query, "__dict__")